@@ -1,17 +1,16 @@
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from contextlib import contextmanager, suppress
 from datetime import datetime
+import errno
 import fnmatch
-from functools import total_ordering, wraps
+from functools import lru_cache, total_ordering, wraps
 import os
 import os.path
 import pathlib
 import re
 import shutil
-import stat
 import sys
-import tempfile
-from typing import Any, BinaryIO, IO, Literal, overload, ParamSpec, TextIO, TypeVar
+from typing import Any, BinaryIO, Concatenate, IO, Literal, overload, ParamSpec, TextIO, TypeVar
 
 if sys.version_info >= (3, 11):
     from collections.abc import Buffer
@@ -27,8 +26,35 @@ from .size_unit_prefixes import BinarySizePrefix, DecimalSizePrefix, SIZE_PREFIX
 
 _P = TypeVar("_P", bound="Path")
 _R = TypeVar("_R")
+_T = TypeVar("_T", bound="str | os.PathLike[str]")
 _S = ParamSpec("_S")
 
+# equivalent to stat.S_IMODE, without the function call
+_S_IMODE_MASK = 0o7777
+
+# on Windows, st_ctime was the creation time until Python 3.12 introduced st_birthtime
+_WINDOWS_CREATED_TIME_ATTR = "st_ctime" if sys.version_info < (3, 12) else "st_birthtime"
+
+# elsewhere, st_birthtime is only available on some platforms (e.g., macOS and FreeBSD, but not Linux)
+_HAS_BIRTHTIME = hasattr(os.stat_result, "st_birthtime")
+
+_FILE_URI_PREFIX = "file://"
+
+# os.copy_file_range is only available on Linux (kernel 4.5+), and may still refuse a given pair of files
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset((errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF))
+
+
+def _new_file_mode() -> int:
+    """Return the permission bits that :py:func:`open` gives a new file, i.e., 0o666 without the process umask.
+
+    :returns: The permission bits for a new file
+    """
+    # the umask can only be read by setting it, so put it straight back
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
 
 def access_error_handler(func: Callable[_S, _R]) -> Callable[_S, _R]:
     """Wrap methods that access paths to catch permission errors and file not found errors."""
@@ -47,8 +73,521 @@ def access_error_handler(func: Callable[_S, _R]) -> Callable[_S, _R]:
     return wrapper
 
 
+def _invalidates_stat(func: Callable[Concatenate[_P, _S], _R]) -> Callable[Concatenate[_P, _S], _R]:
+    """Wrap methods that modify the path on disk so that any stat results memoized for it are discarded afterwards."""
+
+    @wraps(func)
+    def wrapper(self: _P, *args: _S.args, **kwargs: _S.kwargs) -> _R:
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.refresh()
+
+    return wrapper  # type: ignore[return-value]
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(glob: str, *, case_sensitive: bool) -> re.Pattern[str]:
+    """Compile the given glob pattern to a regular expression, memoizing the result.
+
+    :param glob: The glob pattern to compile
+    :param case_sensitive: Whether the compiled pattern should match case-sensitively
+
+    :returns: The compiled regular expression
+    """
+    return re.compile(fnmatch.translate(glob), flags=0 if case_sensitive else re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str, *, case_sensitive: bool) -> re.Pattern[str]:
+    """Compile the given regular expression, memoizing the result.
+
+    The re module keeps its own cache of compiled patterns, but it is shared by every caller in the process and is
+    checked only after building a lookup key from the pattern's type and flags on each call.
+
+    :param pattern: The regular expression to compile
+    :param case_sensitive: Whether the compiled pattern should match case-sensitively
+
+    :returns: The compiled regular expression
+    """
+    return re.compile(pattern, flags=0 if case_sensitive else re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _glob_matcher(glob: str, *, full: bool) -> Callable[[str], bool]:
+    """Return a case-sensitive predicate for the given glob pattern, memoizing the result.
+
+    Most globs in practice are trivial (e.g., "*", "*.pyc", "build*", or a literal name), and those are matched with
+    plain string methods; only globs with wildcards in the middle (or "?" or "[...]") fall back to a regular expression.
+
+    :param glob: The glob pattern to match against
+    :param full: Whether the glob must match the whole string, rather than only its end (as in re.search of the
+        translated pattern, which is anchored at the end)
+
+    :returns: A callable which returns whether a given string matches the glob
+    """
+    leading = glob.startswith("*")
+    trailing = glob.endswith("*") and len(glob) > 1
+    literal = glob[1 if leading else 0 : -1 if trailing else None]
+
+    if "*" in literal or "?" in literal or "[" in literal:
+        pattern = _compile_glob(glob, case_sensitive=True)
+        match_func = pattern.fullmatch if full else pattern.search
+        return lambda string: match_func(string) is not None
+
+    if trailing and (leading or not full):
+        return lambda string: literal in string
+
+    if trailing:
+        return lambda string: string.startswith(literal)
+
+    if leading or not full:
+        return lambda string: string.endswith(literal)
+
+    return lambda string: string == literal
+
+
+def _relative_string(target: pathlib.Path, root: pathlib.Path) -> str | None:
+    """Return the path of `target` relative to `root` as a string, or None if `target` is not within `root`.
+
+    On POSIX, pathlib's string forms are already normalized (no redundant separators, no "." components), so this can
+    be decided with a prefix check, rather than comparing `root` against each of `target.parents` as pathlib does.
+    Elsewhere (or for the ambiguous relative root "."), this defers to pathlib.
+
+    :param target: The path which may be within `root`
+    :param root: The path which may contain `target`
+
+    :returns: The relative path ("." if the paths are equal), or None if `target` is not within `root`
+    """
+    root_string = str(root)
+
+    if os.name == "nt" or root_string == ".":
+        try:
+            return str(target.relative_to(root))
+        except ValueError:
+            return None
+
+    target_string = str(target)
+
+    if target.anchor != root.anchor or not target_string.startswith(root_string):
+        return None
+
+    if len(target_string) == len(root_string):
+        return "."
+
+    if root_string.endswith(os.sep):
+        # the root is the anchor itself (e.g., "/"), so the remainder is already relative
+        return target_string[len(root_string) :]
+
+    if target_string[len(root_string)] != os.sep:
+        # e.g., "/foo/barbaz" is not within "/foo/bar"
+        return None
+
+    return target_string[len(root_string) + 1 :]
+
+
+@lru_cache(maxsize=64)
+def _compile_globs(globs: tuple[str, ...], *, case_sensitive: bool = True) -> re.Pattern[str] | None:
+    """Combine the given glob patterns into a single compiled regular expression which matches if any of them do,
+    memoizing the result.
+
+    :param globs: The glob patterns to combine
+    :param case_sensitive: Whether the compiled pattern should match case-sensitively
+
+    :returns: The compiled regular expression, or None if there are no globs
+    """
+    # repeated globs would only add redundant alternatives for the regex engine to try, so drop them (keeping order)
+    translated = [fnmatch.translate(g) for g in dict.fromkeys(globs)]
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile("|".join(translated), flags=flags) if translated else None
+
+
+def _ignore_globs(globs: Iterable[str]) -> Callable[[str, list[str]], set[str]]:
+    """Return an `ignore` callable for :py:func:`shutil.copytree` that skips names matching any of the given globs.
+
+    Unlike :py:func:`shutil.ignore_patterns`, which matches every name against each pattern in turn, the globs are
+    combined into a single compiled regular expression, so each name is scanned once regardless of how many globs
+    there are.
+
+    :param globs: The glob patterns to ignore; there must be at least one
+
+    :returns: A callable taking (directory, names) and returning the set of names to ignore
+    """
+    # as in fnmatch.filter, case sensitivity follows the platform's filesystem conventions
+    pattern = re.compile("|".join(fnmatch.translate(g) for g in dict.fromkeys(map(os.path.normcase, globs))))
+
+    def ignore(directory: str, names: list[str]) -> set[str]:
+        return {name for name in names if pattern.match(os.path.normcase(name))}
+
+    return ignore
+
+
+def _copyfile_range(src: str | os.PathLike[str], dst: str | os.PathLike[str]) -> None:
+    """Copy the contents of the file `src` to `dst` using :py:func:`os.copy_file_range`.
+
+    This lets the kernel copy the data without passing it through user space, or even share the underlying extents
+    on filesystems which support reflinks (e.g., btrfs and XFS). If the kernel cannot copy between these files (e.g.,
+    across filesystems), this falls back to :py:func:`shutil.copyfile`.
+
+    :param src: The file to copy
+    :param dst: The file to copy to
+
+    :raises OSError: If either file cannot be accessed
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(infd).st_size
+        copied = 0
+
+        try:
+            while remaining > 0:
+                n = os.copy_file_range(infd, outfd, remaining)
+                if n == 0:
+                    break
+
+                copied += n
+                remaining -= n
+        except OSError as e:
+            # only fall back if nothing has been written yet; otherwise, this is a genuine error
+            if copied or e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                raise
+        else:
+            if copied:
+                return
+
+    shutil.copyfile(src, dst)
+
+
+def _is_regular_file_pair(src: str, dst: str) -> bool:
+    """Return whether `src` is a regular file that can be copied onto `dst` by opening both directly.
+
+    Opening a named pipe blocks until its other end is opened, and copying a file onto itself truncates it, so these
+    cases (and other special files) are left to :py:mod:`shutil`, which refuses them.
+
+    :param src: The file to copy
+    :param dst: The file to copy to, which need not exist
+
+    :returns: True if `src` is a regular file and `dst` either doesn't exist or is a different regular file
+    """
+    try:
+        src_stat = os.stat(src)
+    except OSError:
+        return False
+
+    if identify_st_mode(src_stat.st_mode) is not PathType.REGULAR_FILE:
+        return False
+
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+
+    return identify_st_mode(dst_stat.st_mode) is PathType.REGULAR_FILE and not os.path.samestat(src_stat, dst_stat)
+
+
+def _copy_function(*, metadata: bool) -> Callable[[str, str], object]:
+    """Return the function to copy individual files with, as used by :py:func:`shutil.copytree` and friends.
+
+    :param metadata: Whether to copy the file metadata alongside its contents (like :py:func:`shutil.copy2`)
+
+    :returns: A callable taking (source, destination)
+    """
+    fallback = shutil.copy2 if metadata else shutil.copy
+
+    if not _HAS_COPY_FILE_RANGE:
+        return fallback
+
+    def copy(src: str, dst: str) -> str:
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+
+        if not _is_regular_file_pair(src, dst):
+            return fallback(src, dst)
+
+        _copyfile_range(src, dst)
+
+        if metadata:
+            shutil.copystat(src, dst)
+        else:
+            shutil.copymode(src, dst)
+
+        return dst
+
+    return copy
+
+
+def _copytree_parallel(
+    src: str,
+    dst: str,
+    *,
+    copy_function: Callable[[str, str], object],
+    symlinks: bool,
+    dirs_exist_ok: bool,
+    ignore: Callable[[str, list[str]], set[str]] | None,
+    workers: int,
+) -> None:
+    """Recursively copy the directory tree at `src` to `dst`, copying files concurrently.
+
+    This behaves like :py:func:`shutil.copytree` with the same arguments: the directory structure is created on the
+    calling thread, while the files themselves are copied by a pool of `workers` threads. Directory metadata is copied
+    last, once all of the files within have been written.
+
+    :param src: The directory to copy
+    :param dst: The directory to copy to
+    :param copy_function: The function used to copy each file, as in :py:func:`shutil.copytree`
+    :param symlinks: Whether to recreate symlinks as symlinks rather than copying their targets
+    :param dirs_exist_ok: Whether to continue if `dst` (or any directory within it) already exists
+    :param ignore: A callable taking (directory, names) and returning the set of names not to copy
+    :param workers: The maximum number of threads to use
+
+    :raises shutil.Error: If any errors occur; its args is a list of (source, destination, reason) tuples
+    """
+    # concurrent.futures (and the logging machinery it imports) is only needed here, so defer its import cost
+    from concurrent.futures import ThreadPoolExecutor
+
+    errors: list[tuple[str, str, str]] = []
+    directories: list[tuple[str, str]] = []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        copies = []
+        stack = [(src, dst)]
+
+        while stack:
+            src_dir, dst_dir = stack.pop()
+
+            try:
+                with os.scandir(src_dir) as it:
+                    entries = list(it)
+
+                ignored = ignore(src_dir, [entry.name for entry in entries]) if ignore is not None else set()
+                os.makedirs(dst_dir, exist_ok=dirs_exist_ok)
+            except OSError as e:
+                # as in shutil.copytree, only a failure at the top level stops the copy
+                if src_dir == src:
+                    raise
+
+                errors.append((src_dir, dst_dir, str(e)))
+                continue
+
+            directories.append((src_dir, dst_dir))
+
+            for entry in entries:
+                if entry.name in ignored:
+                    continue
+
+                dst_path = os.path.join(dst_dir, entry.name)
+
+                try:
+                    if symlinks and entry.is_symlink():
+                        os.symlink(os.readlink(entry.path), dst_path)
+                        shutil.copystat(entry.path, dst_path, follow_symlinks=False)
+                    elif entry.is_dir():
+                        stack.append((entry.path, dst_path))
+                    else:
+                        copies.append((entry.path, dst_path, pool.submit(copy_function, entry.path, dst_path)))
+                except OSError as e:
+                    errors.append((entry.path, dst_path, str(e)))
+
+        for src_path, dst_path, future in copies:
+            if (exc := future.exception()) is not None:
+                errors.append((src_path, dst_path, str(exc)))
+
+    # copying files into a directory updates its timestamps, so its metadata can only be copied afterwards
+    for src_dir, dst_dir in reversed(directories):
+        try:
+            shutil.copystat(src_dir, dst_dir)
+        except OSError as e:
+            errors.append((src_dir, dst_dir, str(e)))
+
+    if errors:
+        raise shutil.Error(errors)
+
+
+def _scandir_list(path: str | os.PathLike[str]) -> list[os.DirEntry[str]]:
+    """Return the entries of the given directory, as listed by :py:func:`os.scandir`.
+
+    :param path: The directory to list
+
+    :returns: The directory entries, in the order they were listed
+    """
+    with os.scandir(path) as it:
+        return list(it)
+
+
+def _entry_type(entry: os.DirEntry[str]) -> PathType | None:
+    """Return the physical type of a directory entry (not following symlinks), as known from the directory listing.
+
+    :param entry: The directory entry to inspect
+
+    :returns: The type of the entry, or None if it is an unusual type (e.g., a pipe) which needs a stat to identify
+    """
+    if entry.is_symlink():
+        return PathType.SYMLINK
+
+    if entry.is_dir(follow_symlinks=False):
+        return PathType.DIRECTORY
+
+    if entry.is_file(follow_symlinks=False):
+        return PathType.REGULAR_FILE
+
+    return None
+
+
+def _entry_size(entry: os.DirEntry[str], *, follow_symlinks: bool, inode_seen: dict[tuple[int, int], int]) -> int:
+    """Return the size (in bytes) of a non-directory entry, or 0 if another hard link to it was already counted.
+
+    :param entry: The directory entry to stat
+    :param follow_symlinks: Whether to report the size of a symlink target rather than the symlink itself
+    :param inode_seen: The sizes of multiply-linked files counted so far, keyed by (device, inode); updated in place
+
+    :returns: The size of the entry, or 0 if it has already been counted
+    """
+    st = entry.stat(follow_symlinks=follow_symlinks)
+
+    if st.st_nlink > 1:
+        key = (st.st_dev, st.st_ino)
+        if key in inode_seen:
+            return 0
+        inode_seen[key] = st.st_size
+
+    return st.st_size
+
+
+def _iter_sizes(root: str, *, follow_symlinks: bool, inode_seen: dict[tuple[int, int], int]) -> Iterator[int]:
+    """Yield the size (in bytes) of every non-directory entry within the directory tree rooted at `root`.
+
+    The tree is walked iteratively with :py:func:`os.scandir`, and each entry is stat-ed at most once. Files with
+    multiple hard links are only counted the first time their (device, inode) pair is seen, matching `du`.
+
+    :param root: The directory to walk
+    :param follow_symlinks: Whether to report the size of symlink targets rather than the symlinks themselves
+    :param inode_seen: The sizes of multiply-linked files counted so far, keyed by (device, inode); updated in place
+
+    :yields: The size of each (non-duplicate) file in the tree
+    """
+    stack = [root]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield _entry_size(entry, follow_symlinks=follow_symlinks, inode_seen=inode_seen)
+
+
+def _directory_size(root: str, *, follow_symlinks: bool, workers: int) -> int:
+    """Return the total size (in bytes) of the files within the directory tree rooted at `root`.
+
+    With `workers > 1`, each immediate subdirectory of `root` is measured in its own thread. This pays off because
+    the work is dominated by `scandir`/`stat` syscalls, which release the GIL.
+
+    :param root: The directory to measure
+    :param follow_symlinks: Whether to report the size of symlink targets rather than the symlinks themselves
+    :param workers: The maximum number of threads to use
+
+    :returns: The total size of the tree, counting each multiply-linked file once
+    """
+    inode_seen: dict[tuple[int, int], int] = {}
+
+    if workers <= 1:
+        return sum(_iter_sizes(root, follow_symlinks=follow_symlinks, inode_seen=inode_seen))
+
+    def subtree_size(directory: str) -> tuple[int, dict[tuple[int, int], int]]:
+        seen: dict[tuple[int, int], int] = {}
+        return sum(_iter_sizes(directory, follow_symlinks=follow_symlinks, inode_seen=seen)), seen
+
+    total = 0
+    subdirectories = []
+
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            else:
+                total += _entry_size(entry, follow_symlinks=follow_symlinks, inode_seen=inode_seen)
+
+    # with fewer than two subtrees there is nothing to run concurrently, so don't pay for the pool
+    if len(subdirectories) < 2:
+        for directory in subdirectories:
+            total += sum(_iter_sizes(directory, follow_symlinks=follow_symlinks, inode_seen=inode_seen))
+        return total
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(subdirectories))) as pool:
+        futures = [pool.submit(subtree_size, directory) for directory in subdirectories]
+
+        for future in futures:
+            subtotal, seen = future.result()
+            total += subtotal
+
+            # hard links may span subtrees, so discount any inode that was already counted elsewhere
+            for key, size in seen.items():
+                if key in inode_seen:
+                    total -= size
+                else:
+                    inode_seen[key] = size
+
+    return total
+
+
+class _PathParents(Sequence[_P]):
+    """A lazy, immutable sequence of a path's parent directories.
+
+    Each parent is only wrapped as a Path when it is first accessed, so e.g. `p.parents[0]` of a deeply nested path
+    does not construct every ancestor. For compatibility, this compares equal to a tuple of the same parents.
+    """
+
+    __slots__ = ("_path_type", "_parents", "_cache")
+
+    def __init__(self, path: _P) -> None:
+        self._path_type = type(path)
+        self._parents = path._path.parents
+        self._cache: list[_P | None] = [None] * len(self._parents)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @overload
+    def __getitem__(self, index: int) -> _P: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[_P, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> _P | tuple[_P, ...]:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+
+        parent = self._cache[index]
+        if parent is None:
+            parent = self._path_type._from_pathlib_path(
+                self._parents[index], semantic_path_type=SemanticPathType.DIRECTORY
+            )
+            self._cache[index] = parent
+
+        return parent
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (_PathParents, tuple)):
+            return tuple(self) == tuple(other)
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return repr(tuple(self))
+
+
 @total_ordering
 class Path:
+    # many Path objects are created while walking trees, so avoid the per-instance __dict__
+    __slots__ = ("_path", "_semantic_path_type", "_str_cache", "_stat_cache", "_parents_cache")
+
     def __init__(self, *segments: str | os.PathLike[str]) -> None:
         semantics = SemanticPathType.DIRECTORY
 
@@ -66,6 +605,9 @@ class Path:
 
         self._path = pathlib.Path(*segments)
         self._semantic_path_type = semantics
+        self._str_cache: str | None = None
+        self._stat_cache: dict[bool, os.stat_result | OSError] | None = None
+        self._parents_cache: _PathParents[Path] | None = None
 
     def __fspath__(self) -> str:
         """Return the string representation of the path.
@@ -74,7 +616,8 @@ class Path:
 
         :returns: The string representation of the path
         """
-        return self._path.__fspath__()
+        # pathlib caches its string form and its __fspath__ is only a wrapper around str(), so call that directly
+        return str(self._path)
 
     def __semantic_path_type__(self) -> SemanticPathType:
         """Return the semantic path type of this path.
@@ -89,7 +632,11 @@ class Path:
 
         :returns: The human-readable string representation of the path
         """
-        return os.path.normpath(str(self._path)) + self._semantic_path_type.value
+        # paths are immutable, so the normalized string only needs to be computed once
+        if self._str_cache is None:
+            self._str_cache = os.path.normpath(str(self._path)) + self._semantic_path_type.value
+
+        return self._str_cache
 
     def __repr__(self) -> str:
         """Return a string representation of the path.
@@ -105,7 +652,15 @@ class Path:
 
         :returns: True if the paths are equal, False otherwise
         """
+        if self is other:
+            return True
+
         if isinstance(other, type(self)):
+            # identical underlying strings always have the same normalized form, so skip normalizing. This compares
+            # strings rather than pathlib paths, which would ignore case on Windows.
+            if self._semantic_path_type == other._semantic_path_type and str(self._path) == str(other._path):
+                return True
+
             return str(self) == str(other)
 
         if isinstance(other, pathlib.Path):
@@ -167,8 +722,46 @@ class Path:
         inst = cls.__new__(cls)
         inst._path = path
         inst._semantic_path_type = semantic_path_type
+        inst._str_cache = None
+        inst._stat_cache = None
+        inst._parents_cache = None
         return inst
 
+    @classmethod
+    def from_direntry(cls, entry: os.DirEntry[str]) -> Self:
+        """Return a new path object from a directory entry, as yielded by :py:func:`os.scandir`.
+
+        Whether the path is semantically a directory is taken from the entry, which usually knows this from the
+        directory listing itself, without a stat. The entry is not kept, so the new path stats itself as usual.
+
+        >>> with os.scandir("/path/to/directory/") as entries:
+        ...     paths = [Path.from_direntry(entry) for entry in entries]
+
+        :param entry: The directory entry to use
+
+        :returns: A new path object pointing to the directory entry
+        """
+        semantic_path_type = SemanticPathType.DIRECTORY if entry.is_dir() else SemanticPathType.FILE
+        return cls._from_pathlib_path(pathlib.Path(entry.path), semantic_path_type=semantic_path_type)
+
+    @staticmethod
+    def _as_pathlib_path(path: str | os.PathLike[str]) -> pathlib.Path:
+        """Return the given path as a pathlib.Path, reusing the underlying object where possible.
+
+        This should only be used internally.
+
+        :param path: The path to convert
+
+        :returns: The existing pathlib.Path if `path` is (or wraps) one, otherwise a new pathlib.Path
+        """
+        if isinstance(path, Path):
+            return path._path
+
+        if isinstance(path, pathlib.Path):
+            return path
+
+        return pathlib.Path(path)
+
     @classmethod
     def home(cls) -> Self:
         """Return a new path object for the user's home directory.
@@ -208,10 +801,10 @@ class Path:
 
         :raises ValueError: If the URI is invalid or the path is not absolute
         """
-        if not (match := re.match(r"file://(.*)", uri)):
+        if not uri.startswith(_FILE_URI_PREFIX):
             raise ValueError(f"invalid file URI: {uri}")
 
-        filepath = match.group(1)
+        filepath = uri[len(_FILE_URI_PREFIX) :]
         semantic_path_type = cls._identify_semantic_path_type(filepath)
         return cls._from_pathlib_path(pathlib.Path(filepath), semantic_path_type=semantic_path_type)
 
@@ -257,18 +850,20 @@ class Path:
 
         :yields: A new path object pointing to the temporary file
         """
+        import tempfile
+
         # We immediately close the file handler because we don't want to impede on further reads/writes
         # while our context manager is active.
         f, abspath = tempfile.mkstemp(suffix=suffix, prefix=prefix, dir=parent)
         os.close(f)
 
-        p = cls(abspath)
-
         try:
-            yield p
+            yield cls(abspath)
         finally:
             if delete:
-                p.delete(force=True)
+                # we know what we created, so unlink it directly rather than inspecting it via `delete`
+                with suppress(FileNotFoundError):
+                    os.unlink(abspath)
 
     @classmethod
     @contextmanager
@@ -304,13 +899,16 @@ class Path:
 
         :yields: A new path object pointing to the temporary directory
         """
-        temp_dir = cls(tempfile.mkdtemp(suffix=suffix, prefix=prefix, dir=parent) + os.path.sep)
+        import tempfile
+
+        abspath = tempfile.mkdtemp(suffix=suffix, prefix=prefix, dir=parent)
 
         try:
-            yield temp_dir
+            yield cls(abspath + os.path.sep)
         finally:
             if delete:
-                temp_dir.delete(force=True)
+                # we know what we created, so remove it directly rather than inspecting it via `delete`
+                shutil.rmtree(abspath, ignore_errors=True)
 
     def __truediv__(self, other: str | os.PathLike[str]) -> Self:
         """Return a new path by joining the given path with this path.
@@ -325,10 +923,14 @@ class Path:
         :param other: The path to join with this path
         :returns: A new path object to this same path, joined with the given path
         """
-        if not isinstance(other, (str, SemanticPathLike)):
+        # joining a plain string is by far the most common case; skip the (slow) runtime protocol check for it
+        if type(other) is str:
+            semantic_path_type = identify_semantic_path_type(other)
+        elif isinstance(other, (str, SemanticPathLike)):
+            semantic_path_type = self._identify_semantic_path_type(other)
+        else:
             return NotImplemented
 
-        semantic_path_type = self._identify_semantic_path_type(other)
         return type(self)._from_pathlib_path(self._path / other, semantic_path_type=semantic_path_type)
 
     @property
@@ -342,14 +944,16 @@ class Path:
         """
         parts = list(self._path.parts)
 
+        # the rendered components are new strings, but the same few names recur across many paths (e.g., "src/"), so
+        # intern them to share a single copy of each
         for i, part in enumerate(parts[:-1]):
             if part and not part.endswith(os.path.sep):
                 # these are all intermediate directories and should be rendered as such
-                parts[i] = f"{part}{os.path.sep}"
+                parts[i] = sys.intern(f"{part}{os.path.sep}")
 
         if parts and not parts[-1].endswith(os.path.sep):
             # the final component
-            parts[-1] = f"{parts[-1]}{self._semantic_path_type.value}"
+            parts[-1] = sys.intern(f"{parts[-1]}{self._semantic_path_type.value}")
 
         return tuple(parts)
 
@@ -419,25 +1023,30 @@ class Path:
         """
         return self._path.anchor
 
-    def _get_parents_impl(self: _P) -> tuple[_P, ...]:
-        """Return a tuple of the path's parent directories.
+    def _get_parents_impl(self: _P) -> Sequence[_P]:
+        """Return a lazy sequence of the path's parent directories.
         This is an internal method provided as an implementation detail for the parents property
         in order to work around known mypy limitations. Hence the unusual typing of `self: _P.`
 
-        :returns: A tuple of the path's parent directories
+        :returns: A lazy sequence of the path's parent directories
         """
-        return tuple(
-            type(self)._from_pathlib_path(p, semantic_path_type=SemanticPathType.DIRECTORY) for p in self._path.parents
-        )
+        # paths are immutable, so the view (and the parents it wraps) only need to be constructed once
+        if self._parents_cache is None:
+            self._parents_cache = _PathParents(self)
+
+        return self._parents_cache  # type: ignore[return-value]
 
     @property
-    def parents(self) -> tuple[Self, ...]:
-        """Return a tuple of the path's parent directories, in order from the immediate parent to the root.
+    def parents(self) -> Sequence[Self]:
+        """Return a sequence of the path's parent directories, in order from the immediate parent to the root.
+
+        The parents are constructed lazily, as they are accessed. The sequence compares equal to a tuple of the same
+        parents.
 
         >>> Path("/foo/bar/baz.txt").parents
         (Path('/foo/bar/'), Path('/foo/'), Path('/'))
 
-        :returns: A tuple of the path's parent directories
+        :returns: A sequence of the path's parent directories
         """
         return self._get_parents_impl()
 
@@ -450,6 +1059,9 @@ class Path:
 
         :returns: The path's immediate parent directory
         """
+        if self._parents_cache:
+            return self._parents_cache[0]  # type: ignore[return-value]
+
         return type(self)._from_pathlib_path(self._path.parent, semantic_path_type=SemanticPathType.DIRECTORY)
 
     @property
@@ -484,11 +1096,13 @@ class Path:
 
         :returns: A string representing the path's last component's suffix
         """
-        if re.fullmatch(r"\.+", str(self)):
+        string = str(self)
+
+        if string and not string.strip("."):
             # special case: when the path is all dots ("...."), the suffix is always empty
             return ""
 
-        if str(self).endswith("."):
+        if string.endswith("."):
             # when the path ends with a dot (but is not all dots), the suffix is "."
             return "."
 
@@ -512,13 +1126,16 @@ class Path:
 
         :returns: A list of strings representing the path's last component's suffixes
         """
-        if re.fullmatch(r"\.+", str(self)):
+        string = str(self)
+
+        if string and not string.strip("."):
             # special case: when the path is all dots ("...."), the suffix is always empty
             return []
 
-        if str(self).endswith("."):
+        if string.endswith("."):
             # when the path ends with a dot (but is not all dots), the trailing suffix is "."
-            return self.with_name(self.name.rstrip(".")).suffixes + ["."]
+            # compute the remaining suffixes directly from the name, without constructing another Path
+            return pathlib.PurePath(self.name.rstrip(".")).suffixes + ["."]
 
         return self._path.suffixes
 
@@ -628,20 +1245,36 @@ class Path:
         >>> p.conform_to_filesystem()._semantic_path_type
         SemanticPathType.FILE
 
-        If the path does not exist, then the path is normalized, but the semantic type is unchanged:
+        If the path does not exist, then the path is normalized, but the semantic type is unchanged.
 
         :returns: A new path that semantically matches the path on the filesystem
         """
-        target = pathlib.Path(os.path.normpath(str(self)))
+        # pathlib already collapses redundant separators and "."; only reparse if normpath has more to do (e.g., "..")
+        raw = str(self._path)
+        normalized = os.path.normpath(raw)
+        if normalized == raw:
+            source = self
+        else:
+            source = type(self)._from_pathlib_path(
+                pathlib.Path(normalized), semantic_path_type=self._semantic_path_type
+            )
 
+        # resolve the semantic type by checking the path on the filesystem
         try:
-            # resolve the semantic type by checking the path on the filesystem
-            semantic_pathtype = SemanticPathType.DIRECTORY if target.is_dir() else SemanticPathType.FILE
-        except FileNotFoundError:
+            pathtype = source._pathtype(follow_symlinks=True)
+        except OSError:
+            # as with pathlib's is_dir(), a path which can't be stat-ed (e.g., a symlink loop) is not a directory
+            pathtype = PathType.UNKNOWN
+
+        if pathtype == PathType.DOES_NOT_EXIST:
             # fall back to using the existing path semantics
             semantic_pathtype = self._semantic_path_type
+        elif pathtype == PathType.DIRECTORY:
+            semantic_pathtype = SemanticPathType.DIRECTORY
+        else:
+            semantic_pathtype = SemanticPathType.FILE
 
-        return type(self)._from_pathlib_path(target, semantic_path_type=semantic_pathtype)
+        return type(self)._from_pathlib_path(source._path, semantic_path_type=semantic_pathtype)
 
     @access_error_handler
     def read_link(self) -> Self:
@@ -671,7 +1304,7 @@ class Path:
     @access_error_handler
     def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
         """Return an os.stat_result object containing information about this path, like os.stat.
-        The result is looked up at each call to this method.
+        The result is looked up at each call to this method, unless the call is made within :py:meth:`stat_cached`.
 
         Use `follow_symlinks=False` to stat a symlink itself.
 
@@ -685,7 +1318,96 @@ class Path:
 
         :raises FileNotFoundError: If the path does not exist
         """
-        return self._path.stat(follow_symlinks=follow_symlinks)
+        return self._raw_stat(follow_symlinks=follow_symlinks)
+
+    def _raw_stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        """Return the os.stat_result for this path, without translating errors.
+
+        This is the implementation of :py:meth:`stat` for use within methods that are already wrapped by
+        :py:func:`access_error_handler`, so that errors are only handled once.
+
+        :param follow_symlinks: Whether to stat the target of a symbolic link rather than the link itself
+
+        :returns: An os.stat_result object containing information about the path
+        """
+        if self._stat_cache is not None and follow_symlinks in self._stat_cache:
+            cached = self._stat_cache[follow_symlinks]
+            if isinstance(cached, OSError):
+                # raise a fresh copy, so that tracebacks don't accumulate on (or keep frames alive via) the cached one
+                raise type(cached)(cached.errno, cached.strerror, cached.filename)
+
+            return cached
+
+        try:
+            if follow_symlinks:
+                # dispatch to the specific syscall wrapper rather than passing the keyword through
+                result = os.stat(self._path)
+            else:
+                result = os.lstat(self._path)
+        except (FileNotFoundError, NotADirectoryError) as e:
+            # remember that the path doesn't exist, too, so that e.g. repeated exists() checks don't stat again
+            if self._stat_cache is not None:
+                self._stat_cache[follow_symlinks] = type(e)(e.errno, e.strerror, e.filename)
+            raise
+
+        if self._stat_cache is not None:
+            self._stat_cache[follow_symlinks] = result
+
+        return result
+
+    def _pathtype(self, *, follow_symlinks: bool) -> PathType:
+        """Return the physical type of this path, from a single stat.
+
+        :param follow_symlinks: Whether to report the type of a symbolic link's target rather than the link itself
+
+        :returns: The type of the path (PathType.DOES_NOT_EXIST if the path doesn't exist)
+        """
+        try:
+            mode = self._raw_stat(follow_symlinks=follow_symlinks).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            return PathType.DOES_NOT_EXIST
+
+        return identify_st_mode(mode)
+
+    @contextmanager
+    def stat_cached(self) -> Iterator[Self]:
+        """Memoize the stat results of this path for the duration of a `with` block.
+
+        Composite checks (e.g., `exists()` followed by `is_directory()` and `size()`) each stat the path; within this
+        block, the path is stat-ed at most once per value of `follow_symlinks`.
+
+        >>> with Path("/path/to/file").stat_cached() as p:
+        ...     if p.exists() and p.is_file():
+        ...         print(p.size(), p.modified_time())
+
+        .. warning::
+            The cached results are not updated if the path changes on disk while the block is active, except by the
+            methods of this same path object which modify it (e.g., `chmod` or `write_text`). Use :py:meth:`refresh`
+            to discard them.
+
+        Nested blocks on the same path share the outermost block's results.
+
+        :yields: This path
+        """
+        if self._stat_cache is not None:
+            yield self
+            return
+
+        self._stat_cache = {}
+
+        try:
+            yield self
+        finally:
+            self._stat_cache = None
+
+    def refresh(self) -> None:
+        """Discard any stat results memoized for this path, so that the next access stats the path again.
+
+        This only has an effect within :py:meth:`stat_cached`. Methods of this path which modify it on disk (e.g.,
+        `chmod`, `write_text`, or `delete`) call this automatically.
+        """
+        if self._stat_cache is not None:
+            self._stat_cache.clear()
 
     @access_error_handler
     def is_relative_to(self, other: str | os.PathLike[str], *, strict: bool = False) -> bool:
@@ -716,11 +1438,11 @@ class Path:
         :returns: True if the path is relative to (contained within) the path represented by `other`, False otherwise
         """
         if strict:
-            target, root = self._path.resolve(), pathlib.Path(other).resolve()
+            target, root = self._path.resolve(), self._as_pathlib_path(other).resolve()
         else:
-            target, root = self._path, pathlib.Path(other)
+            target, root = self._path, self._as_pathlib_path(other)
 
-        return target.is_relative_to(root)
+        return _relative_string(target, root) is not None
 
     @access_error_handler
     def relative_to(self, other: str | os.PathLike[str], *, strict: bool = False) -> Self:
@@ -753,11 +1475,16 @@ class Path:
         :raises ValueError: If the path is not relative to (contained within) the path represented by `other`
         """
         if strict:
-            target, root = self._path.resolve(), pathlib.Path(other).resolve()
+            target, root = self._path.resolve(), self._as_pathlib_path(other).resolve()
         else:
-            target, root = self._path, pathlib.Path(other)
+            target, root = self._path, self._as_pathlib_path(other)
+
+        relative = _relative_string(target, root)
+        if relative is None:
+            # the same message as pathlib's own error
+            raise ValueError(f"{str(target)!r} is not in the subpath of {str(root)!r}")
 
-        return type(self)._from_pathlib_path(target.relative_to(root), semantic_path_type=self._semantic_path_type)
+        return type(self)._from_pathlib_path(pathlib.Path(relative), semantic_path_type=self._semantic_path_type)
 
     def is_reserved(self) -> bool:
         """Return True if the path is reserved on the current platform.
@@ -846,6 +1573,11 @@ class Path:
 
         :returns: True if the path matches the pattern, False otherwise
         """
+        if isinstance(pattern, str):
+            compiled = _compile_regex(pattern, case_sensitive=case_sensitive)
+            match_method = compiled.fullmatch if full else compiled.search
+            return match_method(str(self)) is not None
+
         match_func = re.fullmatch if full else re.search
         flags = re.IGNORECASE if not case_sensitive else 0
         return match_func(pattern, str(self), flags=flags) is not None
@@ -875,7 +1607,50 @@ class Path:
 
         :returns: True if the path matches the pattern, False otherwise
         """
-        return self.match(fnmatch.translate(glob), full=full, case_sensitive=case_sensitive)
+        if case_sensitive:
+            # the most common case, where trivial globs can be matched without a regular expression
+            return _glob_matcher(glob, full=full)(str(self))
+
+        pattern = _compile_glob(glob, case_sensitive=case_sensitive)
+        match_func = pattern.fullmatch if full else pattern.search
+        return match_func(str(self)) is not None
+
+    @classmethod
+    def filter_glob(
+        cls, paths: Iterable[_T], globs: Iterable[str], *, full: bool = False, case_sensitive: bool = True
+    ) -> list[_T]:
+        """Return those of the given paths which match any of the provided glob patterns.
+
+        This is equivalent to filtering with :py:meth:`.glob_match` for each glob in turn, but the globs are combined
+        into a single compiled regular expression, so each path is scanned once regardless of how many globs there
+        are. The paths may be strings or path-like objects and are returned as given, in their original order.
+
+        >>> Path.filter_glob(["src/main.py", "src/main.pyc", "README.md"], ["*.py", "*.md"])
+        ['src/main.py', 'README.md']
+
+        :param paths:
+            The paths to filter
+
+        :param globs:
+            The glob patterns to match against
+
+        :param full:
+            If True, then a pattern must match the full path (uses re.fullmatch under the hood);
+            if False, then a pattern need match only part of the path (uses re.search under the hood)
+
+        :param case_sensitive:
+            If True, then the glob patterns are matched exactly, case-sensitively;
+            if False, then the matching is performed while ignoring case (re.IGNORECASE)
+
+        :returns: A list of the paths which match at least one of the globs
+        """
+        pattern = _compile_globs(tuple(globs), case_sensitive=case_sensitive)
+
+        if pattern is None:
+            return []
+
+        match_func = pattern.fullmatch if full else pattern.search
+        return [path for path in paths if match_func(str(path)) is not None]
 
     def with_name(self, name: str) -> Self:
         """Return a path with the name (last path component) changed to `name`.
@@ -938,9 +1713,9 @@ class Path:
         :returns: A new path with the suffix changed
         """
         if suffix == ".":
-            p = type(self)(f"{self._path.with_suffix('')}.")
-            p._semantic_path_type = self._semantic_path_type
-            return p
+            return type(self)._from_pathlib_path(
+                pathlib.Path(f"{self._path.with_suffix('')}."), semantic_path_type=self._semantic_path_type
+            )
 
         return type(self)._from_pathlib_path(
             self._path.with_suffix(suffix), semantic_path_type=self._semantic_path_type
@@ -985,17 +1760,23 @@ class Path:
 
         :returns: True if the path exists, False otherwise
         """
-        try:
-            mode = self.stat(follow_symlinks=follow_symlinks).st_mode
-        except (FileNotFoundError, NotADirectoryError):
+        return self._exists_as(self._pathtype(follow_symlinks=follow_symlinks), strict=strict)
+
+    def _exists_as(self, pathtype: PathType, *, strict: bool) -> bool:
+        """Return whether a path of the given physical type counts as existing, as in :py:meth:`exists`.
+
+        :param pathtype: The physical type of this path, as returned by :py:meth:`_pathtype`
+        :param strict: If True, then the path must exist with the same semantic path type.
+
+        :returns: True if the path exists, False otherwise
+        """
+        if pathtype == PathType.DOES_NOT_EXIST:
             return False
 
         if not strict:
             # it doesn't matter what's there, as long as it exists
             return True
 
-        pathtype = identify_st_mode(mode)
-
         if self._semantic_path_type == SemanticPathType.DIRECTORY:
             return pathtype == PathType.DIRECTORY
         else:
@@ -1022,10 +1803,7 @@ class Path:
 
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         """
-        if not self.exists(follow_symlinks=False, strict=False):
-            return PathType.DOES_NOT_EXIST
-
-        return identify_st_mode(self.stat(follow_symlinks=False).st_mode)
+        return self._pathtype(follow_symlinks=False)
 
     @access_error_handler
     def is_directory(self, *, follow_symlinks: bool = True, must_exist: bool = False) -> bool:
@@ -1060,18 +1838,15 @@ class Path:
 
         :raises OSError: If the path cannot be accessed due to, e.g., permission errors.
         """
-        target = self.resolve() if follow_symlinks else self
+        pathtype = self._pathtype(follow_symlinks=follow_symlinks)
 
-        if target.type == PathType.DIRECTORY:
-            return True
-
-        if target.type == PathType.DOES_NOT_EXIST:
+        if pathtype == PathType.DOES_NOT_EXIST:
             if must_exist:
                 return False
 
             return self._semantic_path_type == SemanticPathType.DIRECTORY
 
-        return False
+        return pathtype == PathType.DIRECTORY
 
     @access_error_handler
     def is_file(self, *, follow_symlinks: bool = True, must_exist: bool = False) -> bool:
@@ -1113,18 +1888,15 @@ class Path:
 
         :raises OSError: If the path cannot be accessed due to, e.g., permission errors.
         """
-        target = self.resolve() if follow_symlinks else self
+        pathtype = self._pathtype(follow_symlinks=follow_symlinks)
 
-        if target.type not in (PathType.DIRECTORY, PathType.UNKNOWN):
-            return True
-
-        if target.type == PathType.DOES_NOT_EXIST:
+        if pathtype == PathType.DOES_NOT_EXIST:
             if must_exist:
                 return False
 
             return self._semantic_path_type == SemanticPathType.FILE
 
-        return False
+        return pathtype not in (PathType.DIRECTORY, PathType.UNKNOWN)
 
     @access_error_handler
     def is_same_file(self, other: os.PathLike[str]) -> bool:
@@ -1134,7 +1906,7 @@ class Path:
 
         :returns: True if the path is the same file as `other`, False otherwise
         """
-        return self._path.samefile(pathlib.Path(other))
+        return self._path.samefile(self._as_pathlib_path(other))
 
     @overload
     @access_error_handler
@@ -1214,13 +1986,14 @@ class Path:
         errors: str | None = None,
         newline: str | None = None,
     ) -> list[str]:
-        """Read the contents of the file, returning a list of the line contents.
+        """Read the contents of the file, returning a list of the line contents (without their line endings).
 
         >>> Path("/path/to/file").write_lines(["Hello", "world!"])
         >>> Path("/path/to/file").read_lines()
         ['Hello', 'world!']
 
-        These parameters have the same meaning as in :py:meth:`builtins.open`.
+        Lines are separated as in :py:meth:`iter_lines`. These parameters have the same meaning as in
+        :py:meth:`builtins.open`.
 
         :param encoding: The encoding to use
         :param errors: The error handling to use (or `None` for default)
@@ -1228,7 +2001,43 @@ class Path:
 
         :returns: A list of the lines in the file
         """
-        return self.read_text(encoding=encoding, errors=errors, newline=newline).splitlines()
+        return list(self.iter_lines(encoding=encoding, errors=errors, newline=newline))
+
+    @access_error_handler
+    def iter_lines(
+        self,
+        *,
+        encoding: str = "utf-8",
+        errors: str | None = None,
+        newline: str | None = None,
+    ) -> Iterator[str]:
+        """Iterate over the lines of the file (without their line endings), reading the file as it goes.
+
+        Unlike :py:meth:`read_lines`, the whole file is never held in memory at once, which makes this suitable for
+        very large files.
+
+        >>> for line in Path("/path/to/file").iter_lines():
+        ...     print(line)
+
+        Lines are separated as by iterating over a file object, i.e., only at line endings (LF, CR, or CRLF, subject to
+        `newline`), and exactly one line ending is removed from each line. Unlike :py:meth:`str.splitlines`, other
+        separators (e.g., form feeds, vertical tabs, or U+2028) are kept within their line. These parameters have the
+        same meaning as in :py:meth:`builtins.open`.
+
+        :param encoding: The encoding to use
+        :param errors: The error handling to use (or `None` for default)
+        :param newline: The newline character to use (or `None` for default)
+
+        :yields: Each line in the file
+        """
+        with open(self, mode="rt", encoding=encoding, errors=errors, newline=newline) as f:
+            for line in f:
+                if line.endswith("\r\n"):
+                    yield line[:-2]
+                elif line.endswith(("\n", "\r")):
+                    yield line[:-1]
+                else:
+                    yield line
 
     @access_error_handler
     def read_bytes(self) -> bytes:
@@ -1244,6 +2053,7 @@ class Path:
             return f.read()
 
     @access_error_handler
+    @_invalidates_stat
     def write_bytes(self, data: Buffer, *, mode: Literal["w", "a"] = "w") -> int:
         """Open the file pointed to in binary mode, write `data` to it, and close the file.
         If `mode = "w"`, an existing file of the same name is overwritten; if `mode = "a"`, data is written to the end.
@@ -1266,6 +2076,7 @@ class Path:
             return f.write(data)
 
     @access_error_handler
+    @_invalidates_stat
     def write_text(
         self,
         data: str,
@@ -1301,6 +2112,7 @@ class Path:
             return f.write(data)
 
     @access_error_handler
+    @_invalidates_stat
     def write_lines(
         self,
         lines: Iterable[str],
@@ -1329,6 +2141,7 @@ class Path:
             f.writelines(lines)
 
     @access_error_handler
+    @_invalidates_stat
     def write_text_atomic(
         self,
         data: str,
@@ -1351,16 +2164,32 @@ class Path:
         :param errors: The error handling to use (or `None` for default)
         :param newline: The newline character to use (or `None` for default)
         """
-        with type(self).temporary_file() as temp_path:
-            temp_path.write_text(data)
+        # tempfile is rarely needed, so it is imported on first use rather than with this module
+        import tempfile
+
+        # write through a symlink to the file it points to, rather than replacing the link itself
+        target = pathlib.Path(os.path.realpath(self._path)) if os.path.islink(self._path) else self._path
 
+        # mkstemp creates the file as 0o600, so give it the mode the file has (or would get from open) instead
         try:
-            temp_path.replace(self)
-        except Exception:
-            try:
-                temp_path.delete()
-            except OSError:
-                pass
+            mode = os.stat(target).st_mode & _S_IMODE_MASK
+        except FileNotFoundError:
+            mode = _new_file_mode()
+
+        # the temporary file must be on the same filesystem as the target for the final rename to be atomic
+        fd, temp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+
+        try:
+            with os.fdopen(fd, mode="w", encoding=encoding, errors=errors, newline=newline) as f:
+                os.chmod(f.fileno() if os.chmod in os.supports_fd else temp_name, mode)
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_name, target)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(temp_name)
             raise
 
     @access_error_handler
@@ -1385,15 +2214,18 @@ class Path:
         >>> for child in Path("/path/to/directory/").iterdir():
         ...     print(child)
 
+        The children are created with :py:meth:`from_direntry`, so whether each is a directory is known without an
+        extra stat (on most platforms).
+
         :yields: Direct children of this path
 
         :raises FileNotFoundError: If this path does not exist
         :raises NotADirectoryError: If this path is not a directory
         :raises OSError: If this path cannot be accessed for, e.g., permissions reasons.
         """
-        for path in self._path.iterdir():
-            semantics = SemanticPathType.DIRECTORY if path.is_dir() else SemanticPathType.FILE
-            yield type(self)._from_pathlib_path(path, semantic_path_type=semantics)
+        with os.scandir(self._path) as entries:
+            for entry in entries:
+                yield type(self).from_direntry(entry)
 
     @access_error_handler
     def copy(
@@ -1405,6 +2237,7 @@ class Path:
         maintain_symlinks: bool = False,
         dirs_exist_ok: bool = False,
         ignore: Iterable[str] | None = None,
+        workers: int = 1,
     ) -> None:
         """Copy this path to the given path (`to`). Optionally, also copy metadata.
 
@@ -1462,6 +2295,13 @@ class Path:
 
             A list of glob patterns that should be ignored when copying a directory.
 
+        :param workers:
+            Only used when the source (`self`) is a directory:
+
+            The maximum number of threads to use. If greater than 1, files are copied concurrently, which can be much
+            faster for large trees (particularly on SSDs and network filesystems).
+
+        :raises ValueError: If `workers` is less than 1.
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If any path cannot be accessed for, e.g., permissions reasons.
         :raises OSError: If any errors occur while copying directory-to-directory. In this case, the args attribute will
@@ -1471,21 +2311,35 @@ class Path:
         if not self.exists(follow_symlinks=False):
             raise FileNotFoundError(f"Cannot copy from nonexisting path: {self}")
 
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, not {workers}")
+
         copy_function = shutil.copy2 if metadata else shutil.copy
 
         if self.is_directory():
-            if ignore is None:
-                ignore = tuple()
+            ignore = tuple(ignore) if ignore is not None else ()
+            ignore_function = _ignore_globs(ignore) if ignore else None
 
             try:
-                shutil.copytree(
-                    self,
-                    to,
-                    copy_function=copy_function,
-                    symlinks=maintain_symlinks,
-                    dirs_exist_ok=dirs_exist_ok,
-                    ignore=shutil.ignore_patterns(*ignore),
-                )
+                if workers > 1:
+                    _copytree_parallel(
+                        str(self._path),
+                        os.fspath(to),
+                        copy_function=copy_function,
+                        symlinks=maintain_symlinks,
+                        dirs_exist_ok=dirs_exist_ok,
+                        ignore=ignore_function,
+                        workers=workers,
+                    )
+                else:
+                    shutil.copytree(
+                        self,
+                        to,
+                        copy_function=copy_function,
+                        symlinks=maintain_symlinks,
+                        dirs_exist_ok=dirs_exist_ok,
+                        ignore=ignore_function,
+                    )
             except shutil.Error as e:
                 raise OSError(f"Error while copying directory {self} -> {to}", *e.args)
         else:
@@ -1507,9 +2361,6 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If either path cannot be accessed for, e.g., permissions reasons.
         """
-        if not self.exists(follow_symlinks=False):
-            raise FileNotFoundError(f"Cannot copy permissions for nonexistent path: {self}")
-
         shutil.copymode(self, to, follow_symlinks=follow_symlinks)
 
     @access_error_handler
@@ -1530,12 +2381,10 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If either path cannot be accessed for, e.g., permissions reasons.
         """
-        if not self.exists(follow_symlinks=False):
-            raise FileNotFoundError(f"Cannot copy stat for nonexistent path: {self}")
-
         shutil.copystat(self, to, follow_symlinks=follow_symlinks)
 
     @access_error_handler
+    @_invalidates_stat
     def delete(self, *, recursive: bool = False, strict: bool = True, force: bool = False) -> None:
         """Delete this path (file, symlink, or directory). With `force=False`, raise an error if the path doesn't exist.
 
@@ -1567,10 +2416,12 @@ class Path:
         :raises FileNotFoundError: If `force=False` and the path does not exist.
         :raises OSError: If the path cannot be deleted for any reason, e.g., permissions reasons.
         """
-        if not force and not self.exists(follow_symlinks=False, strict=strict):
+        pathtype = self._pathtype(follow_symlinks=False)
+
+        if not force and not self._exists_as(pathtype, strict=strict):
             raise FileNotFoundError(f"Cannot delete nonexistent path: {self}")
 
-        if self.is_directory(follow_symlinks=False):
+        if pathtype == PathType.DIRECTORY:
             if recursive or force:
                 shutil.rmtree(self, ignore_errors=force)
             else:
@@ -1582,6 +2433,7 @@ class Path:
             self._path.unlink()
 
     @access_error_handler
+    @_invalidates_stat
     def move(self, to: Self, *, metadata: bool = True) -> Self:
         """Recursively move this path to the given destination (`to`), returning the new path.
 
@@ -1613,18 +2465,15 @@ class Path:
         :raises OSError: If either path cannot be accessed for, e.g., permissions reasons.
         :raises OSError: If `self` is a file and `to` is a directory that already contains a file with the same name.
         """
-        if not self.exists(follow_symlinks=False):
-            raise FileNotFoundError(f"Cannot move nonexistent path: {self}")
-
-        copy_function = shutil.copy2 if metadata else shutil.copy
         try:
-            dest = pathlib.Path(shutil.move(self, to, copy_function=copy_function))
+            dest = pathlib.Path(shutil.move(self, to, copy_function=_copy_function(metadata=metadata)))
         except shutil.Error:
             raise OSError(f"Destination path {str(to).rstrip(os.path.sep)}/{self.name} already exists")
 
         return type(self)._from_pathlib_path(dest, semantic_path_type=self._semantic_path_type)
 
     @access_error_handler
+    @_invalidates_stat
     def rename(self, to: str | os.PathLike[str], *, force: bool = True) -> Self:
         """Rename this path to the given name, forcibly overwriting the target with `force=True`.
 
@@ -1647,15 +2496,13 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If either path cannot be accessed for, e.g., permissions reasons.
         """
-        if not self.exists(follow_symlinks=False):
-            raise FileNotFoundError(f"Cannot rename nonexistent path: {self}")
-
         if force:
             return self.replace(to)
 
         return type(self)._from_pathlib_path(self._path.rename(to), semantic_path_type=self._semantic_path_type)
 
     @access_error_handler
+    @_invalidates_stat
     def replace(self, to: str | os.PathLike[str]) -> Self:
         """Rename this path to the given name, overwriting the target if it exists.
 
@@ -1674,9 +2521,6 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If either path cannot be accessed for, e.g., permissions reasons.
         """
-        if not self.exists(follow_symlinks=False):
-            raise FileNotFoundError(f"Cannot replace nonexistent path: {self}")
-
         return type(self)._from_pathlib_path(self._path.replace(to), semantic_path_type=self._semantic_path_type)
 
     @access_error_handler
@@ -1689,12 +2533,10 @@ class Path:
 
         :raises FileNotFoundError: If this path does not exist
         """
-        if not self.exists(follow_symlinks=False):
-            raise FileNotFoundError(f"Cannot report disk usage for nonexistent path: {self}")
-
         return DiskUsage(*shutil.disk_usage(self))
 
     @access_error_handler
+    @_invalidates_stat
     def chown(
         self,
         *,
@@ -1733,9 +2575,6 @@ class Path:
         :raises OSError: If `follow_symlinks=False`, the path is a symbolic link, and the platform does not support
         changing metadata of a symlink.
         """
-        if not self.exists(follow_symlinks=False):
-            raise FileNotFoundError(f"Cannot change owner/group for nonexistent path: {self}")
-
         if os.name == "nt":
             raise OSError("chown is not supported on Windows.")
 
@@ -1748,6 +2587,7 @@ class Path:
         os.chown(self, uid, gid, follow_symlinks=follow_symlinks)
 
     @access_error_handler
+    @_invalidates_stat
     def chmod(self, mode: int, *, follow_symlinks: bool = True) -> None:
         """Change the permissions of the given path.
 
@@ -1768,9 +2608,6 @@ class Path:
         :raises OSError: If `follow_symlinks=False`, the path is a symbolic link, and the platform does not support
         changing metadata of a symlink.
         """
-        if not self.exists(follow_symlinks=False):
-            raise FileNotFoundError(f"Cannot change permissions for nonexistent path: {self}")
-
         os.chmod(self, mode, follow_symlinks=follow_symlinks)
 
     @access_error_handler
@@ -1801,34 +2638,6 @@ class Path:
         """
         return type(self)(other).is_relative_to(self, strict=True)
 
-    @access_error_handler
-    def _get_relative_depth(self, other: Self) -> int:
-        """Returns the number of components in `other` relative to `self`.
-
-        >>> Path("/path/to/file")._get_relative_depth(Path("/path/to/file"))
-        0
-        >>> Path("/path/to/")._get_relative_depth(Path("/path/to/file"))
-        1
-        >>> Path("/path/")._get_relative_depth(Path("/path/to/file"))
-        2
-        >>> Path("/path/to/file")._get_relative_depth(Path("/path/to/somewhere/else/"))
-        ValueError("Path '/path/to/somewhere/else/' is not contained within '/path/to/file'.")
-
-        :param other:
-            The path to check.
-        :return:
-            The number of components in `other` relative to `self`.
-            In other words, the "depth" of `other` relative to `self`.
-        """
-        if other not in self:
-            raise ValueError(f"Path {other} is not contained within {self}.")
-
-        if self.is_same_file(other):
-            # before Python 3.12, self.relative_to(self) was Path("."), which has length 1
-            return 0
-
-        return len(other.relative_to(self).parts)
-
     @access_error_handler
     def walk(
         self, *, top_down: bool = True, on_error: Callable[[OSError], None] | None = None, follow_symlinks: bool = False
@@ -1888,6 +2697,10 @@ class Path:
         :raises OSError: If any error occurs while walking the directory tree (e.g., permission errors).
         """
         for root_name, dirnames, filenames in os.walk(str(self), top_down, on_error, followlinks=follow_symlinks):
+            # names repeat heavily across a large tree (e.g., "__pycache__"), so share one copy of each; this is done in
+            # place, so that pruning `dirnames` still affects the walk
+            dirnames[:] = map(sys.intern, dirnames)
+            filenames[:] = map(sys.intern, filenames)
             yield type(self)(root_name), dirnames, filenames
 
     @access_error_handler
@@ -1900,6 +2713,7 @@ class Path:
         show_hidden: bool = True,
         max_depth: int | None = None,
         exclude_globs: Iterable[str] | None = None,
+        workers: int = 1,
     ) -> Iterator[Self]:
         """Iterate over every item (directory and file) within the given path.
 
@@ -1983,39 +2797,163 @@ class Path:
         :param exclude_globs:
             A list of glob patterns to exclude from the traversal.
 
+        :param workers:
+            The maximum number of threads to use to list directories. If greater than 1, directories are listed
+            concurrently, which can be much faster for large trees (particularly on network filesystems). In this case,
+            each directory is still yielded before its contents, but otherwise the order is not deterministic, and
+            `top_down=False` is not supported.
+
         :yields: Path objects for each directory and file.
 
+        :raises ValueError: If `workers` is less than 1, or if `workers > 1` and `top_down=False`.
         :raises OSError: If any error occurs while walking the directory tree (e.g., permission errors).
         """
-        exclude_patterns = [re.compile(fnmatch.translate(g)) for g in exclude_globs] if exclude_globs else []
+        for path, _, _ in self._traverse_with_depth(
+            top_down=top_down,
+            on_error=on_error,
+            follow_symlinks=follow_symlinks,
+            show_hidden=show_hidden,
+            max_depth=max_depth,
+            exclude_globs=exclude_globs,
+            workers=workers,
+        ):
+            yield path
 
-        for root_name, dirnames, filenames in os.walk(str(self), top_down, on_error, follow_symlinks):
-            root = type(self)(root_name)
+    def _traverse_with_depth(
+        self,
+        *,
+        top_down: bool = True,
+        on_error: Callable[[OSError], None] | None = None,
+        follow_symlinks: bool = False,
+        show_hidden: bool = True,
+        max_depth: int | None = None,
+        exclude_globs: Iterable[str] | None = None,
+        workers: int = 1,
+    ) -> Iterator[tuple[Self, int, os.DirEntry[str] | None]]:
+        """Iterate over every item within the given path, alongside its depth relative to this path.
+
+        This is the implementation of :py:meth:`traverse`, which takes the same arguments. The depth is tracked from
+        the walk itself, so that callers (e.g., :py:meth:`find`) don't need to recompute it from each path.
+
+        The directory entry is only meant for decisions made during the walk itself (e.g., filtering by type), as its
+        cached information goes stale; the yielded paths do not keep it.
+
+        :yields: A 3-tuple (path, depth, entry) for each directory and file, where this path itself has depth 0 and
+            no directory entry.
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, not {workers}")
+
+        if workers > 1 and not top_down:
+            raise ValueError("top_down=False is not supported with workers > 1")
+
+        exclude_pattern = _compile_globs(tuple(exclude_globs)) if exclude_globs else None
+
+        # a directory still to be scanned is kept as
+        # (path, path relative to self with a trailing separator, depth, directory entry)
+        def classify(
+            directory: Self,
+            prefix: str,
+            depth: int,
+            directory_entry: os.DirEntry[str] | None,
+            entries: list[os.DirEntry[str]],
+        ) -> tuple[
+            list[tuple[Self, int, os.DirEntry[str] | None]], list[tuple[Self, str, int, os.DirEntry[str] | None]]
+        ]:
+            results: list[tuple[Self, int, os.DirEntry[str] | None]] = [(directory, depth, directory_entry)]
+            subdirectories: list[tuple[Self, str, int, os.DirEntry[str] | None]] = []
+
+            if max_depth is not None and depth >= max_depth:
+                return results, subdirectories
+
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                except OSError:
+                    is_dir = False
+
+                relative = prefix + entry.name
+
+                if is_dir:
+                    if exclude_pattern is None or not exclude_pattern.match(relative):
+                        subdirectories.append((self.from_direntry(entry), relative + os.sep, depth + 1, entry))
+                    continue
 
-            if exclude_patterns:
-                base = type(self)(".") if self == root else root.relative_to(self)
-                dirnames[:] = [d for d in dirnames if not any(excl.match(str(base / d)) for excl in exclude_patterns)]
+                if entry.name.startswith(".") and not show_hidden:
+                    continue
 
-            if max_depth is not None:
-                depth = root._get_relative_depth(self)
+                if exclude_pattern is not None and exclude_pattern.match(relative):
+                    continue
 
-                if depth >= max_depth:
-                    # prevent further recursion
-                    dirnames.clear()
+                results.append((self.from_direntry(entry), depth + 1, entry))
 
-            yield root
+            return results, subdirectories
 
-            for filename in filenames:
-                path = root / filename
+        if workers > 1:
+            from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
-                if filename.startswith(".") and not show_hidden:
-                    continue
+            # list directories concurrently (scandir releases the GIL), but filter and yield on this thread only
+            pool = ThreadPoolExecutor(max_workers=workers)
 
-                relpath = str(path.relative_to(self))
-                if exclude_patterns and any(excl.match(relpath) for excl in exclude_patterns):
-                    continue
+            try:
+                pending: dict[Future[list[os.DirEntry[str]]], tuple[Self, str, int, os.DirEntry[str] | None]] = {
+                    pool.submit(_scandir_list, self): (self, "", 0, None)
+                }
 
-                yield path
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        directory, prefix, depth, directory_entry = pending.pop(future)
+
+                        try:
+                            entries = future.result()
+                        except OSError as e:
+                            if on_error is not None:
+                                on_error(e)
+                            continue
+
+                        results, subdirectories = classify(directory, prefix, depth, directory_entry, entries)
+
+                        for subdirectory in subdirectories:
+                            pending[pool.submit(_scandir_list, subdirectory[0])] = subdirectory
+
+                        yield from results
+            finally:
+                # the caller may stop iterating early, so don't wait for (or start) any outstanding listings
+                pool.shutdown(wait=False, cancel_futures=True)
+
+            return
+
+        # when walking bottom-up, a directory's own results are pushed beneath its subdirectories until they are done
+        stack: list[
+            tuple[Self, str, int, os.DirEntry[str] | None] | list[tuple[Self, int, os.DirEntry[str] | None]]
+        ] = [(self, "", 0, None)]
+
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                yield from item
+                continue
+
+            directory, prefix, depth, directory_entry = item
+
+            try:
+                entries = _scandir_list(directory)
+            except OSError as e:
+                if on_error is not None:
+                    on_error(e)
+                continue
+
+            results, subdirectories = classify(directory, prefix, depth, directory_entry, entries)
+
+            if top_down:
+                yield from results
+            else:
+                stack.append(results)
+
+            # reversed, so that the subdirectories are popped (and so walked) in the order they were listed
+            stack.extend(reversed(subdirectories))
 
     @access_error_handler
     def find(
@@ -2030,6 +2968,7 @@ class Path:
         type: PathType | Iterable[PathType] | None = None,
         extension: str | None = None,
         show_hidden: bool = True,
+        workers: int = 1,
     ) -> Iterator[Self]:
         """Return an iterator over the paths within the given path that match all of the given conditions.
 
@@ -2113,53 +3052,78 @@ class Path:
         :param show_hidden:
             If True, hidden files are included; if False, all hidden files are skipped.
 
+        :param workers:
+            The maximum number of threads to use to list directories, as in :py:meth:`traverse`.
+
         :yields: Path objects for each directory and file that match all of the conditions.
 
+        :raises ValueError: If `workers` is less than 1.
         :raises OSError: If any error occurs while walking the directory tree (e.g., permission errors).
         """
 
-        def get_allowed_types() -> list[PathType]:
+        def get_allowed_types() -> frozenset[PathType]:
             if type is None:
-                return []
+                return frozenset()
 
             if isinstance(type, PathType):
-                return [type]
+                return frozenset((type,))
 
-            return list(type)
+            return frozenset(type)
 
-        def get_pattern() -> re.Pattern[str]:
+        def get_name_matcher() -> Callable[[str], bool] | None:
             if glob and isinstance(pattern, re.Pattern):
                 raise ValueError("If glob is True, pattern must be a string, not a compiled regular expression.")
 
             if isinstance(pattern, re.Pattern):
-                return pattern
+                compiled = pattern
+            elif not pattern:
+                # the empty pattern matches every name, so don't bother searching
+                return None
+            elif glob:
+                return _glob_matcher(pattern, full=False)
+            else:
+                compiled = re.compile(pattern)
 
-            return re.compile(fnmatch.translate(pattern) if glob else pattern)
+            return lambda name: compiled.search(name) is not None
 
         allowed_types = get_allowed_types()
-        pattern = get_pattern()
+        name_matches = get_name_matcher()
+        suffix = f".{extension.lstrip('.')}" if extension else None
 
-        for path in self.traverse(
+        paths_with_depth = self._traverse_with_depth(
             follow_symlinks=follow_symlinks,
             show_hidden=show_hidden,
             max_depth=max_depth,
             exclude_globs=exclude_globs,
-        ):
-            if not pattern.search(path.name):
-                continue
+            workers=workers,
+        )
+
+        if min_depth is None and name_matches is None and not allowed_types and suffix is None:
+            # nothing to filter on, so skip the per-path checks entirely
+            for path, _, _ in paths_with_depth:
+                yield path
+            return
 
-            if min_depth is not None and min_depth > path._get_relative_depth(self):
+        for path, depth, entry in paths_with_depth:
+            if min_depth is not None and depth < min_depth:
                 continue
 
-            if allowed_types and path.type not in allowed_types:
+            if name_matches is not None and not name_matches(path.name):
                 continue
 
-            if extension and path.suffix != f".{extension.lstrip('.')}":
+            if allowed_types:
+                # the directory entry usually knows the type already, so this needs a stat only for unusual types
+                path_type = _entry_type(entry) if entry is not None else None
+                if (path_type or path.type) not in allowed_types:
+                    continue
+
+            if suffix is not None and path.suffix != suffix:
                 continue
 
             yield path
 
     @access_error_handler
+    @_invalidates_stat
     def touch(self, *, mode: int = 0o666, exist_ok: bool = True, strict: bool = True) -> None:
         """Create an empty file at this path.
 
@@ -2185,6 +3149,7 @@ class Path:
         self._path.touch(mode=mode, exist_ok=exist_ok)
 
     @access_error_handler
+    @_invalidates_stat
     def mkdir(self, *, mode: int = 0o777, parents: bool = False, exist_ok: bool = False, strict: bool = True) -> None:
         """Create a directory at this path.
 
@@ -2212,6 +3177,7 @@ class Path:
         self._path.mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
 
     @access_error_handler
+    @_invalidates_stat
     def symlink_to(self, target: str | os.PathLike[str], *, target_is_directory: bool = False) -> None:
         """Make this path a symbolic link pointing to `target`.
 
@@ -2231,6 +3197,7 @@ class Path:
         self._path.symlink_to(target, target_is_directory=target_is_directory)
 
     @access_error_handler
+    @_invalidates_stat
     def hardlink_to(self, target: str | os.PathLike[str]) -> None:
         """Make this path a hard link pointing to `target`.
 
@@ -2258,16 +3225,7 @@ class Path:
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         :raises OSError: If the user name cannot be determined on this platform.
         """
-        if os.name == "nt":
-            raise OSError("Owner name cannot be determined on this platform.")
-
-        try:
-            import pwd
-        except ImportError:
-            # collapse the NotImplementedError/pathlib.UnsupportedOperation dichotomy
-            raise OSError("Owner name cannot be determined on this platform.")
-
-        return pwd.getpwuid(self.owner_id(follow_symlinks=follow_symlinks)).pw_name
+        return usergroup.get_user_name_of(self._raw_stat(follow_symlinks=follow_symlinks).st_uid)
 
     @access_error_handler
     def owner_id(self, *, follow_symlinks: bool = True) -> int:
@@ -2285,7 +3243,7 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         """
-        return self.stat(follow_symlinks=follow_symlinks).st_uid
+        return self._raw_stat(follow_symlinks=follow_symlinks).st_uid
 
     @access_error_handler
     def group(self, *, follow_symlinks: bool = True) -> str:
@@ -2304,16 +3262,7 @@ class Path:
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         :raises OSError: If the group name cannot be determined on this platform.
         """
-        if os.name == "nt":
-            raise OSError("Group name cannot be determined on this platform.")
-
-        try:
-            import grp
-        except ImportError:
-            # collapse the NotImplementedError/pathlib.UnsupportedOperation dichotomy
-            raise OSError("Group name cannot be determined on this platform.")
-
-        return grp.getgrgid(self.group_id(follow_symlinks=follow_symlinks)).gr_name
+        return usergroup.get_group_name_of(self._raw_stat(follow_symlinks=follow_symlinks).st_gid)
 
     @access_error_handler
     def group_id(self, *, follow_symlinks: bool = True) -> int:
@@ -2331,7 +3280,7 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         """
-        return self.stat(follow_symlinks=follow_symlinks).st_gid
+        return self._raw_stat(follow_symlinks=follow_symlinks).st_gid
 
     @access_error_handler
     def mode(self, *, follow_symlinks: bool = True) -> int:
@@ -2351,8 +3300,7 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         """
-        mode = self.stat(follow_symlinks=follow_symlinks).st_mode
-        return stat.S_IMODE(mode)
+        return self._raw_stat(follow_symlinks=follow_symlinks).st_mode & _S_IMODE_MASK
 
     @access_error_handler
     def permission_string(self, *, follow_symlinks: bool = True) -> str:
@@ -2368,7 +3316,7 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         """
-        return oct(self.mode(follow_symlinks=follow_symlinks))
+        return oct(self._raw_stat(follow_symlinks=follow_symlinks).st_mode & _S_IMODE_MASK)
 
     @access_error_handler
     def inode(self, *, follow_symlinks: bool = True) -> int:
@@ -2386,7 +3334,7 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         """
-        return self.stat(follow_symlinks=follow_symlinks).st_ino
+        return self._raw_stat(follow_symlinks=follow_symlinks).st_ino
 
     @access_error_handler
     def device(self, *, follow_symlinks: bool = True) -> int:
@@ -2404,7 +3352,7 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         """
-        return self.stat(follow_symlinks=follow_symlinks).st_dev
+        return self._raw_stat(follow_symlinks=follow_symlinks).st_dev
 
     @access_error_handler
     def hardlinks(self, *, follow_symlinks: bool = True) -> int:
@@ -2422,7 +3370,7 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         """
-        return self.stat(follow_symlinks=follow_symlinks).st_nlink
+        return self._raw_stat(follow_symlinks=follow_symlinks).st_nlink
 
     @access_error_handler
     def size(
@@ -2430,6 +3378,7 @@ class Path:
         *,
         follow_symlinks: bool = True,
         unit: DecimalSizePrefix | BinarySizePrefix = "B",
+        workers: int = 1,
     ) -> float:
         """Return the size of the file or directory, in the given unit.
 
@@ -2440,7 +3389,9 @@ class Path:
         >>> Path("/path/to/file/with/size/41229/bytes").size(unit="KiB")
         40.26269531
 
-        When `self` is a directory, return the size of the entire tree with this path as the root.
+        When `self` is a directory (or, with `follow_symlinks=True`, a symlink to one), return the size of the entire
+        tree with this path as the root. As with `du`, files with multiple hard links within the tree are only counted
+        once.
 
         :param follow_symlinks:
             If True and `self` is a symbolic link, return the size of the target of the link;
@@ -2449,24 +3400,34 @@ class Path:
         :param unit: The unit to return the size in. It must be one of "B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB",
         "YB", or their binary equivalents ("KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB", "RiB", "QiB").
 
+        :param workers:
+            Only used when `self` is a directory:
+
+            The maximum number of threads to use. If greater than 1, the immediate subdirectories of `self` are
+            measured concurrently, which can be much faster for large trees (particularly on network filesystems).
+
         :returns: The size of the file or directory in the given unit.
+
+        :raises ValueError: If `unit` is not a valid size unit or `workers` is less than 1.
         """
-        if unit not in SIZE_PREFIX_CONVERSIONS.keys():
+        factor = SIZE_PREFIX_CONVERSIONS.get(unit)
+        if factor is None:
             raise ValueError(f"Invalid size unit: {unit}")
 
-        factor = SIZE_PREFIX_CONVERSIONS[unit]
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, not {workers}")
 
-        if self.type == PathType.DIRECTORY:
-            total = 0.0
+        st = self._raw_stat(follow_symlinks=follow_symlinks)
+
+        if identify_st_mode(st.st_mode) == PathType.DIRECTORY:
             try:
-                for child in self:
-                    total += child.size(follow_symlinks=follow_symlinks, unit="B")
+                total = _directory_size(str(self._path), follow_symlinks=follow_symlinks, workers=workers)
             except OSError as e:
                 raise OSError(f"Failed to calculate recursive size for directory: {self}. Details: {e}")
 
             return total / factor
 
-        return self.stat(follow_symlinks=follow_symlinks).st_size / factor
+        return st.st_size / factor
 
     @access_error_handler
     def accessed_time(self, *, follow_symlinks: bool = True) -> datetime:
@@ -2480,7 +3441,7 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         """
-        return datetime.fromtimestamp(self.stat(follow_symlinks=follow_symlinks).st_atime)
+        return datetime.fromtimestamp(self._raw_stat(follow_symlinks=follow_symlinks).st_atime)
 
     @access_error_handler
     def modified_time(self, *, follow_symlinks: bool = True) -> datetime:
@@ -2494,7 +3455,7 @@ class Path:
         :raises FileNotFoundError: If this path does not exist
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         """
-        return datetime.fromtimestamp(self.stat(follow_symlinks=follow_symlinks).st_mtime)
+        return datetime.fromtimestamp(self._raw_stat(follow_symlinks=follow_symlinks).st_mtime)
 
     @access_error_handler
     def metadata_modified_time(self, *, follow_symlinks: bool = True) -> datetime:
@@ -2509,29 +3470,41 @@ class Path:
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
 
         """
-        return datetime.fromtimestamp(self.stat(follow_symlinks=follow_symlinks).st_ctime)
+        return datetime.fromtimestamp(self._raw_stat(follow_symlinks=follow_symlinks).st_ctime)
 
-    @access_error_handler
     def _created_time_windows(self, *, follow_symlinks: bool = True) -> datetime:
-        """Return the creation time of the file (Windows implementation)."""
-        attr = "st_ctime" if sys.version_info < (3, 12) else "st_birthtime"
-        stat_info = self.stat(follow_symlinks=follow_symlinks)
+        """Return the creation time of the file (Windows implementation of :py:meth:`created_time`).
 
-        ts = getattr(stat_info, attr)
+        :returns: The creation time of the file
+
+        :raises FileNotFoundError: If this path does not exist
+        :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
+        """
+        stat_info = self._raw_stat(follow_symlinks=follow_symlinks)
+
+        ts = getattr(stat_info, _WINDOWS_CREATED_TIME_ATTR)
         return datetime.fromtimestamp(ts)
 
-    @access_error_handler
     def _created_time_posix(self, *, follow_symlinks: bool = True) -> datetime:
-        """Return the creation time of the file (POSIX implementation)."""
-        try:
-            # st_birthtime is not always available
-            # "type ignore" is used because mypy cannot determine whether it exists
-            ts = self.stat(follow_symlinks=follow_symlinks).st_birthtime  # type: ignore
-        except AttributeError:
+        """Return the creation time of the file (POSIX implementation of :py:meth:`created_time`).
+
+        :returns: The creation time of the file
+
+        :raises FileNotFoundError: If this path does not exist
+        :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
+        :raises OSError: If the creation time cannot be determined on this platform.
+        """
+        if not _HAS_BIRTHTIME:
             raise OSError("Creation time cannot be determined on this platform.")
 
+        # "type ignore" is used because mypy cannot determine whether st_birthtime exists
+        ts = self._raw_stat(follow_symlinks=follow_symlinks).st_birthtime  # type: ignore
+
         return datetime.fromtimestamp(ts)
 
+    # the platform never changes at runtime, so the implementation is chosen once, at class creation
+    _created_time_impl = _created_time_windows if os.name == "nt" else _created_time_posix
+
     @access_error_handler
     def created_time(self, *, follow_symlinks: bool = True) -> datetime:
         """Return the creation time of the file.
@@ -2545,8 +3518,4 @@ class Path:
         :raises OSError: If the path cannot be accessed for, e.g., permissions reasons.
         :raises OSError: If the creation time cannot be determined on this platform.
         """
-
-        if os.name == "nt":
-            return self._created_time_windows(follow_symlinks=follow_symlinks)
-
-        return self._created_time_posix(follow_symlinks=follow_symlinks)
+        return self._created_time_impl(follow_symlinks=follow_symlinks)
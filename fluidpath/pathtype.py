@@ -1,6 +1,9 @@
 from enum import auto, Enum
 import stat
 
+# equivalent to stat.S_IFMT, without the function call
+_S_IFMT_MASK = 0o170000
+
 
 class PathType(Enum):
     """An enumeration of various physical path types."""
@@ -15,31 +18,22 @@ class PathType(Enum):
     DOES_NOT_EXIST = auto()
 
 
+# the file type bits are mutually exclusive, so a single lookup replaces testing for each type in turn
+_IFMT_TO_PATHTYPE = {
+    stat.S_IFREG: PathType.REGULAR_FILE,
+    stat.S_IFDIR: PathType.DIRECTORY,
+    stat.S_IFLNK: PathType.SYMLINK,
+    stat.S_IFIFO: PathType.PIPE,
+    stat.S_IFCHR: PathType.CHAR_DEVICE,
+    stat.S_IFBLK: PathType.BLOCK_DEVICE,
+    stat.S_IFSOCK: PathType.SOCKET,
+}
+
+
 def identify_st_mode(mode: int) -> PathType:
     """Identify the path type from the given stat mode.
     
     :param mode: The mode of the path, as returned by :py:func:`os.stat`, via `os.stat(path).st_mode`.
     :returns: The path type
     """
-    if stat.S_ISREG(mode):
-        return PathType.REGULAR_FILE
-
-    if stat.S_ISDIR(mode):
-        return PathType.DIRECTORY
-
-    if stat.S_ISLNK(mode):
-        return PathType.SYMLINK
-
-    if stat.S_ISFIFO(mode):
-        return PathType.PIPE
-
-    if stat.S_ISCHR(mode):
-        return PathType.CHAR_DEVICE
-
-    if stat.S_ISBLK(mode):
-        return PathType.BLOCK_DEVICE
-
-    if stat.S_ISSOCK(mode):
-        return PathType.SOCKET
-
-    return PathType.UNKNOWN
+    return _IFMT_TO_PATHTYPE.get(mode & _S_IFMT_MASK, PathType.UNKNOWN)
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 import os
 from typing import Protocol, runtime_checkable
 
@@ -10,19 +11,20 @@ class SemanticPathType(Enum):
     DIRECTORY = os.path.sep
 
 
+# trailing characters which mark a path as a directory; "/" is accepted as a separator on every platform
+_DIRECTORY_SUFFIXES = tuple({os.path.sep, "/"})
+_DIRECTORY_NAMES = frozenset((".", ".."))
+
+
+# paths are built from the same few tails over and over (".py", "/", ...), so remember the answers
+@lru_cache(maxsize=1024)
 def identify_semantic_path_type(path: str) -> SemanticPathType:
     """Interpret the semantic meaning of the given string path.
 
     :param path: The path string to interpret.
     :returns: The interpreted semantic path type.
     """
-    if path in (".", ".."):
-        return SemanticPathType.DIRECTORY
-
-    if path.endswith(os.path.sep):
-        return SemanticPathType.DIRECTORY
-
-    if os.path.sep != "/" and path.endswith("/"):
+    if path.endswith(_DIRECTORY_SUFFIXES) or path in _DIRECTORY_NAMES:
         return SemanticPathType.DIRECTORY
 
     return SemanticPathType.FILE
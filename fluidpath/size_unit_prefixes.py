@@ -1,23 +1,25 @@
+from types import MappingProxyType
 from typing import Literal
 
 # type aliases for size prefixes
 DecimalSizePrefix = Literal["B", "K", "M", "G", "T", "P", "E", "Z", "Y", "R", "Q"]
 BinarySizePrefix = Literal["B", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei", "Zi", "Yi", "Ri", "Qi"]
 
-# dict of size conversions between the given units and bytes
-# "KB": 1000.0 means that 1 KB is 1000 bytes
-SIZE_PREFIX_CONVERSIONS = {
+# size conversions between the given units and bytes
+# "KB": 1000 means that 1 KB is 1000 bytes
+# the factors are kept as exact integers, since floats cannot represent 10**23 and above exactly
+_SIZE_PREFIX_CONVERSIONS = {
     "B": 1,
-    "KB": 1e3,
-    "MB": 1e6,
-    "GB": 1e9,
-    "TB": 1e12,
-    "PB": 1e15,
-    "EB": 1e18,
-    "ZB": 1e21,
-    "YB": 1e24,
-    "RB": 1e27,
-    "QB": 1e30,
+    "KB": 10**3,
+    "MB": 10**6,
+    "GB": 10**9,
+    "TB": 10**12,
+    "PB": 10**15,
+    "EB": 10**18,
+    "ZB": 10**21,
+    "YB": 10**24,
+    "RB": 10**27,
+    "QB": 10**30,
     "KiB": 1 << 10,
     "MiB": 1 << 20,
     "GiB": 1 << 30,
@@ -29,3 +31,6 @@ SIZE_PREFIX_CONVERSIONS = {
     "RiB": 1 << 90,
     "QiB": 1 << 100,
 }
+
+# read-only view, so that the shared table cannot be modified by callers
+SIZE_PREFIX_CONVERSIONS: MappingProxyType[str, int] = MappingProxyType(_SIZE_PREFIX_CONVERSIONS)
@@ -1,3 +1,45 @@
+from functools import lru_cache
+
+# user/group names are unavailable on platforms without these modules (e.g., Windows)
+try:
+    import grp
+except ImportError:
+    grp = None  # type: ignore[assignment]
+
+try:
+    import pwd
+except ImportError:
+    pwd = None  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=256)
+def _uid_of_name(name: str) -> int:
+    """Return the user ID of the given username, memoizing the result.
+
+    Each lookup may read /etc/passwd (or query a directory service), so repeated lookups of the same name are cached.
+    Call `_uid_of_name.cache_clear()` if the user database changes.
+
+    :param name: The username of the user.
+    :returns: The user ID of the given user.
+    :raises KeyError: If the username is not a valid user on this system.
+    """
+    return pwd.getpwnam(name).pw_uid
+
+
+@lru_cache(maxsize=256)
+def _gid_of_name(name: str) -> int:
+    """Return the group ID of the given group name, memoizing the result.
+
+    Each lookup may read /etc/group (or query a directory service), so repeated lookups of the same name are cached.
+    Call `_gid_of_name.cache_clear()` if the group database changes.
+
+    :param name: The name of the group.
+    :returns: The group ID of the given group.
+    :raises KeyError: If the group name is not a valid group on this system.
+    """
+    return grp.getgrnam(name).gr_gid
+
+
 def get_uid_of(user: int | str | None) -> int:
     """Return the user ID of the given user.
 
@@ -10,13 +52,11 @@ def get_uid_of(user: int | str | None) -> int:
         return -1
 
     if isinstance(user, str):
-        try:
-            import pwd
-        except ImportError:
+        if pwd is None:
             raise OSError("Cannot get user ID with string username on this platform.")
 
         # raises KeyError if `user` cannot be found
-        return pwd.getpwnam(user).pw_uid
+        return _uid_of_name(user)
 
     return user
 
@@ -33,12 +73,40 @@ def get_gid_of(group: int | str | None) -> int:
         return -1
 
     if isinstance(group, str):
-        try:
-            import grp
-        except ImportError:
+        if grp is None:
             raise OSError("Cannot get group ID with string group name on this platform.")
 
         # raises KeyError if `group` cannot be found
-        return grp.getgrnam(group).gr_gid
+        return _gid_of_name(group)
 
     return group
+
+
+def get_user_name_of(uid: int) -> str:
+    """Return the name of the user with the given user ID.
+
+    :param uid: The user ID of the user.
+    :returns: The username of the given user.
+    :raises OSError: If the uid --> string mapping is not available on this platform.
+    :raises KeyError: If `uid` is not a valid user on this system.
+    """
+    if pwd is None:
+        # collapse the NotImplementedError/pathlib.UnsupportedOperation dichotomy
+        raise OSError("Owner name cannot be determined on this platform.")
+
+    return pwd.getpwuid(uid).pw_name
+
+
+def get_group_name_of(gid: int) -> str:
+    """Return the name of the group with the given group ID.
+
+    :param gid: The group ID of the group.
+    :returns: The name of the given group.
+    :raises OSError: If the gid --> string mapping is not available on this platform.
+    :raises KeyError: If `gid` is not a valid group on this system.
+    """
+    if grp is None:
+        # collapse the NotImplementedError/pathlib.UnsupportedOperation dichotomy
+        raise OSError("Group name cannot be determined on this platform.")
+
+    return grp.getgrgid(gid).gr_name
@@ -8,8 +8,27 @@ import fluidpath
 from fluidpath.semantic_pathtype import SemanticPathType
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--run-slow", action="store_true", default=False, help="also run tests marked as slow")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "slow: the test is slow or memory-hungry; it only runs with --run-slow")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow; pass --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture(scope="function")
-def mock_fs(tmp_path: pathlib.Path) -> Iterator[fluidpath.Path]:
+def mock_fs(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[fluidpath.Path]:
+    """Build a small directory tree under `tmp_path` and make it the working directory for the test."""
     root = tmp_path / "root"
     root.mkdir()
 
@@ -36,4 +55,7 @@ def mock_fs(tmp_path: pathlib.Path) -> Iterator[fluidpath.Path]:
     os.symlink(root / "a", root / "symlink-to-dir")
     os.symlink(root / "nonexistent-target", root / "broken-symlink")
 
+    # every test using the tree also resolves relative paths against it
+    monkeypatch.chdir(root)
+
     yield fluidpath.Path._from_pathlib_path(root, semantic_path_type=SemanticPathType.DIRECTORY)
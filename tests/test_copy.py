@@ -0,0 +1,84 @@
+import errno
+import os
+from typing import Any
+
+import pytest
+
+from fluidpath import Path
+
+
+def test_copy_file(mock_fs: Path) -> None:
+    src = mock_fs / "a" / "b" / "file.txt"
+    dst = mock_fs / "copy.txt"
+    src.copy(dst)
+
+    assert dst.read_text() == src.read_text()
+
+
+def test_copy_directory(mock_fs: Path) -> None:
+    src = mock_fs / "a/"
+    dst = mock_fs / "copy/"
+    src.copy(dst)
+
+    assert (dst / "b" / "file.txt").read_text() == "contents of b/file.txt"
+    assert (dst / "c" / "d" / "image.png").exists()
+
+
+def test_copy_directory_with_ignore(mock_fs: Path) -> None:
+    src = mock_fs / "a/"
+    dst = mock_fs / "copy/"
+    src.copy(dst, ignore=["*.log", "*.png"])
+
+    assert (dst / "c" / "file.txt").exists()
+    assert not (dst / "c" / "file2.log").exists()
+    assert not (dst / "c" / "d" / "image.png").exists()
+    assert (dst / "c" / "d/").exists()
+
+
+def test_copy_directory_with_workers(mock_fs: Path) -> None:
+    src = mock_fs / "a/"
+    dst = mock_fs / "copy/"
+    src.copy(dst, workers=4, ignore=["*.log"])
+
+    assert (dst / "b" / "file.txt").read_text() == "contents of b/file.txt"
+    assert (dst / "c" / "d" / "image.png").exists()
+    assert not (dst / "c" / "file2.log").exists()
+
+
+def test_copy_directory_with_workers_existing_destination(mock_fs: Path) -> None:
+    src = mock_fs / "a/"
+    dst = mock_fs / "copy/"
+    src.copy(dst, workers=4)
+
+    with pytest.raises(OSError):
+        src.copy(dst, workers=4)
+
+    src.copy(dst, workers=4, dirs_exist_ok=True)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_copy_directory_unreadable_subdirectory(mock_fs: Path, monkeypatch: pytest.MonkeyPatch, workers: int) -> None:
+    src = mock_fs / "a/"
+    dst = mock_fs / "copy/"
+    unreadable = os.fspath(src / "c/").rstrip(os.sep)
+    scandir = os.scandir
+
+    def unreadable_scandir(path: Any) -> Any:
+        if os.fspath(path).rstrip(os.sep) == unreadable:
+            raise PermissionError(errno.EACCES, "Permission denied", path)
+        return scandir(path)
+
+    # simulate the directory's permissions, which wouldn't stop a test run as root
+    monkeypatch.setattr(os, "scandir", unreadable_scandir)
+
+    with pytest.raises(OSError, match="Permission denied"):
+        src.copy(dst, workers=workers)
+
+    # the error is collected, and the rest of the tree is still copied
+    assert (dst / "b" / "file.txt").read_text() == "contents of b/file.txt"
+    assert not (dst / "c/").exists()
+
+
+def test_copy_invalid_workers(mock_fs: Path) -> None:
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        (mock_fs / "a/").copy(mock_fs / "copy/", workers=0)
@@ -1,38 +1,67 @@
+import os
+
 import pytest
 
 from fluidpath import Path
 
 
-def test_is_directory_exists(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_is_directory_exists(mock_fs: Path) -> None:
     p = mock_fs / "a" / "b"
     assert p.is_directory()
 
 
-def test_is_directory_exists_via_symlink(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_is_directory_exists_via_symlink(mock_fs: Path) -> None:
     p = mock_fs / "symlink-to-dir"
     assert p.is_directory()
 
 
-def test_is_directory_exists_via_symlink_without_following(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_is_directory_exists_via_symlink_without_following(mock_fs: Path) -> None:
     p = mock_fs / "symlink-to-dir"
     assert not p.is_directory(follow_symlinks=False)
 
 
-def test_is_directory_does_not_exist_must_exist_true(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_is_directory_does_not_exist_must_exist_true(mock_fs: Path) -> None:
     p = mock_fs / "does-not-exist/"
     assert not p.is_directory(must_exist=True)
 
 
-def test_is_directory_does_not_exist_must_exist_false(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_is_directory_does_not_exist_must_exist_false(mock_fs: Path) -> None:
     p = mock_fs.join_path("does-not-exist/")
     assert p.is_directory(must_exist=False)
+
+
+def test_is_file_does_not_exist_must_exist_true(mock_fs: Path) -> None:
+    p = mock_fs / "does-not-exist"
+    assert not p.is_file(must_exist=True)
+
+
+def test_is_file_does_not_exist_must_exist_false(mock_fs: Path) -> None:
+    p = mock_fs / "does-not-exist"
+    assert p.is_file(must_exist=False)
+
+
+def test_iterdir_semantics(mock_fs: Path) -> None:
+    children = {child.name: child for child in mock_fs.iterdir()}
+    assert str(children["a"]).endswith("a/")
+    assert str(children["symlink-to-dir"]).endswith("symlink-to-dir/")
+    assert not str(children["no-extension"]).endswith("/")
+    assert not str(children["broken-symlink"]).endswith("/")
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("a/b/file.txt/", "a/b/file.txt"),
+        ("a/b", "a/b/"),
+        ("a/c/../b/file.txt", "a/b/file.txt"),
+        ("a/missing/", "a/missing/"),
+        ("a/missing.txt", "a/missing.txt"),
+    ],
+)
+def test_conform_to_filesystem(mock_fs: Path, path: str, expected: str) -> None:
+    assert str(Path(path).conform_to_filesystem()) == expected
+
+
+def test_conform_to_filesystem_symlink_loop(mock_fs: Path) -> None:
+    os.symlink("loop", mock_fs / "loop")
+    assert str(Path("loop/").conform_to_filesystem()) == "loop"
@@ -1,3 +1,7 @@
+import re
+
+import pytest
+
 from fluidpath import Path
 
 
@@ -21,6 +25,18 @@ def test_match_true_without_full_case_insensitive() -> None:
     assert p.match(".*F.*xt", full=False, case_sensitive=False)
 
 
+def test_match_case_sensitive_after_case_insensitive() -> None:
+    p = Path("root") / "a" / "b" / "file.txt"
+    assert p.match(".*F.*xt", full=False, case_sensitive=False)
+    assert not p.match(".*F.*xt", full=False)
+
+
+def test_match_compiled_pattern() -> None:
+    p = Path("root") / "a" / "b" / "file.txt"
+    assert p.match(re.compile(r"root/.*f.*xt"), full=True)
+    assert not p.match(re.compile(r"f.*xt"), full=True)
+
+
 def test_glob_match_true_with_full() -> None:
     p = Path("root") / "a" / "b" / "file.txt"
     assert p.glob_match("root/*f*xt")
@@ -39,3 +55,45 @@ def test_glob_match_true_with_full_case_insensitive() -> None:
 def test_glob_match_true_without_full_case_insensitive() -> None:
     p = Path("root") / "a" / "b" / "file.txt"
     assert p.glob_match("*F*xt", full=False, case_sensitive=False)
+
+
+@pytest.mark.parametrize(
+    "glob, full, expected",
+    [
+        ("*", True, True),
+        ("*.txt", True, True),
+        ("*.log", True, False),
+        ("root*", True, True),
+        ("a*", True, False),
+        ("a*", False, True),
+        ("*/b/*", True, True),
+        ("file.txt", True, False),
+        ("file.txt", False, True),
+        ("root/a/b/file.txt", True, True),
+        ("*/?/file.txt", True, True),
+    ],
+)
+def test_glob_match_trivial_globs(glob: str, full: bool, expected: bool) -> None:
+    p = Path("root") / "a" / "b" / "file.txt"
+    assert p.glob_match(glob, full=full) is expected
+
+
+@pytest.mark.parametrize(
+    "globs, full, case_sensitive, expected",
+    [
+        (["*.py", "*.md"], False, True, ["root/a/main.py", "root/README.md"]),
+        (["*.PY"], False, True, []),
+        (["*.PY"], False, False, ["root/a/main.py"]),
+        (["main.py"], True, True, []),
+        (["root/*.py"], True, True, ["root/a/main.py"]),
+        ([], False, True, []),
+    ],
+)
+def test_filter_glob(globs: list[str], full: bool, case_sensitive: bool, expected: list[str]) -> None:
+    paths = ["root/a/main.py", "root/a/main.pyc", "root/README.md"]
+    assert Path.filter_glob(paths, globs, full=full, case_sensitive=case_sensitive) == expected
+
+
+def test_filter_glob_paths() -> None:
+    paths = [Path("root") / "a" / "main.py", Path("root") / "a/", Path("root") / "b.txt"]
+    assert Path.filter_glob(paths, ["*/", "*.py"]) == paths[:2]
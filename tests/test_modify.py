@@ -0,0 +1,75 @@
+import errno
+import os
+
+import pytest
+
+from fluidpath import Path
+
+
+def test_delete_file(mock_fs: Path) -> None:
+    p = mock_fs / "a" / "b" / "file.txt"
+    p.delete()
+
+    assert not p.exists(follow_symlinks=False)
+
+
+def test_delete_directory_recursive(mock_fs: Path) -> None:
+    p = mock_fs / "a/"
+    p.delete(recursive=True)
+
+    assert not p.exists(follow_symlinks=False)
+
+
+def test_delete_wrong_semantics_strict(mock_fs: Path) -> None:
+    p = mock_fs / "a" / "b" / "file.txt/"
+    with pytest.raises(FileNotFoundError):
+        p.delete(strict=True)
+
+    p.delete(strict=False)
+    assert not p.exists(follow_symlinks=False, strict=False)
+
+
+def test_delete_nonexistent(mock_fs: Path) -> None:
+    p = mock_fs / "missing.txt"
+    with pytest.raises(FileNotFoundError):
+        p.delete()
+
+    p.delete(force=True)
+
+
+@pytest.mark.parametrize("method", ["chmod", "rename", "replace", "disk_usage"])
+def test_modify_nonexistent(mock_fs: Path, method: str) -> None:
+    p = mock_fs / "missing.txt"
+    args = {"chmod": (0o644,), "rename": ("other.txt",), "replace": ("other.txt",), "disk_usage": ()}[method]
+
+    with pytest.raises(FileNotFoundError):
+        getattr(p, method)(*args)
+
+
+@pytest.mark.parametrize("metadata", [True, False])
+def test_move_across_filesystems(mock_fs: Path, monkeypatch: pytest.MonkeyPatch, metadata: bool) -> None:
+    def rename(src: str, dst: str) -> None:
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    # force shutil.move to copy and delete, as it would between filesystems
+    monkeypatch.setattr(os, "rename", rename)
+
+    moved = (mock_fs / "a/").move(mock_fs / "moved/", metadata=metadata)
+
+    assert not (mock_fs / "a/").exists()
+    assert (moved / "b" / "file.txt").read_text() == "contents of b/file.txt"
+    assert (moved / "c" / "d" / "image.png").exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes are unavailable on this platform")
+def test_move_fifo_across_filesystems(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    os.mkfifo(mock_fs / "fifo")
+
+    def rename(src: str, dst: str) -> None:
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "rename", rename)
+
+    # copying would otherwise block until something opens the other end of the pipe
+    with pytest.raises(OSError, match="named pipe"):
+        (mock_fs / "fifo").move(mock_fs / "moved")
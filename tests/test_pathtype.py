@@ -1,37 +1,31 @@
 import os
 import socket
+import stat
 import sys
 
 import pytest
 
 from fluidpath import Path, PathType
+from fluidpath.pathtype import identify_st_mode
 
 
-def test_pathtype_regular_file(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_pathtype_regular_file(mock_fs: Path) -> None:
     p = mock_fs / "a" / "b" / "file.txt"
     assert p.type == PathType.REGULAR_FILE
 
 
-def test_pathtype_directory(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_pathtype_directory(mock_fs: Path) -> None:
     p = mock_fs / "a" / "b"
     assert p.type == PathType.DIRECTORY
 
 
-def test_pathtype_symlink(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_pathtype_symlink(mock_fs: Path) -> None:
     p = mock_fs / "symlink-to-file"
     assert p.type == PathType.SYMLINK
 
 
 @pytest.mark.skipif(sys.platform == "win32", reason="Requires POSIX (os.mkfifo)")
-def test_pathtype_pipe(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_pathtype_pipe(mock_fs: Path) -> None:
     p = mock_fs / "pipe"
 
     os.mkfifo(str(p))
@@ -45,9 +39,7 @@ def test_pathtype_char_device_dev_null() -> None:
     assert p.type == PathType.CHAR_DEVICE
 
 
-def test_pathtype_socket(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_pathtype_socket(mock_fs: Path) -> None:
     p = mock_fs / "socket"
     with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
         s.bind(str(p))
@@ -55,8 +47,23 @@ def test_pathtype_socket(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None
     assert p.type == PathType.SOCKET
 
 
-def test_pathtype_does_not_exist(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_pathtype_does_not_exist(mock_fs: Path) -> None:
     p = mock_fs / "does-not-exist"
     assert p.type == PathType.DOES_NOT_EXIST
+
+
+@pytest.mark.parametrize(
+    "mode, expected",
+    [
+        (stat.S_IFREG | 0o644, PathType.REGULAR_FILE),
+        (stat.S_IFDIR | 0o755, PathType.DIRECTORY),
+        (stat.S_IFLNK | 0o777, PathType.SYMLINK),
+        (stat.S_IFIFO, PathType.PIPE),
+        (stat.S_IFCHR, PathType.CHAR_DEVICE),
+        (stat.S_IFBLK, PathType.BLOCK_DEVICE),
+        (stat.S_IFSOCK, PathType.SOCKET),
+        (0o644, PathType.UNKNOWN),
+    ],
+)
+def test_identify_st_mode(mode: int, expected: PathType) -> None:
+    assert identify_st_mode(mode) == expected
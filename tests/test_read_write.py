@@ -0,0 +1,86 @@
+import os
+import stat
+import sys
+
+import pytest
+
+from fluidpath import Path
+
+
+def test_write_text_atomic_new_file(mock_fs: Path) -> None:
+    p = mock_fs / "a" / "new-file.txt"
+    p.write_text_atomic("Hello world!")
+
+    assert p.read_text() == "Hello world!"
+    assert sorted(child.name for child in p.parent) == ["b", "c", "new-file.txt"]
+
+
+def test_write_text_atomic_overwrite(mock_fs: Path) -> None:
+    p = mock_fs / "a" / "b" / "file.txt"
+    p.write_text_atomic("new contents")
+
+    assert p.read_text() == "new contents"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="permission bits are not fully supported on Windows")
+def test_write_text_atomic_keeps_mode(mock_fs: Path) -> None:
+    existing = mock_fs / "a" / "b" / "file.txt"
+    os.chmod(existing, 0o640)
+    existing.write_text_atomic("new contents")
+    assert stat.S_IMODE(os.stat(existing).st_mode) == 0o640
+
+    umask = os.umask(0o022)
+    try:
+        new = mock_fs / "a" / "new-file.txt"
+        new.write_text_atomic("Hello world!")
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(os.stat(new).st_mode) == 0o644
+
+
+def test_write_text_atomic_through_symlink(mock_fs: Path) -> None:
+    # NB: mock_fs/symlink-to-file --> mock_fs/a/b/file.txt
+    link = mock_fs / "symlink-to-file"
+    link.write_text_atomic("new contents")
+
+    assert os.path.islink(link)
+    assert (mock_fs / "a" / "b" / "file.txt").read_text() == "new contents"
+    assert not any(name.endswith(".tmp") for name in os.listdir(mock_fs / "a" / "b"))
+
+
+@pytest.mark.parametrize(
+    "contents, lines",
+    [
+        ("", []),
+        ("Hello", ["Hello"]),
+        ("Hello\nworld!", ["Hello", "world!"]),
+        ("Hello\nworld!\n", ["Hello", "world!"]),
+        ("Hello\r\nworld!\r\n", ["Hello", "world!"]),
+        ("Hello\n\nworld!", ["Hello", "", "world!"]),
+    ],
+)
+def test_read_lines(mock_fs: Path, contents: str, lines: list[str]) -> None:
+    p = mock_fs / "lines.txt"
+    p.write_bytes(contents.encode())
+
+    assert p.read_lines() == lines
+    assert list(p.iter_lines()) == lines
+
+
+@pytest.mark.parametrize(
+    "contents, newline, lines",
+    [
+        # only one line ending is removed, even if the line's contents end with a carriage return
+        ("Hello\r\r\nworld!", "\r\n", ["Hello\r", "world!"]),
+        ("Hello\r\rworld!", "", ["Hello", "", "world!"]),
+        # other str.splitlines() separators don't end a line
+        ("Hello\fworld!\vagain\u2028and\x85again\x1c!", None, ["Hello\fworld!\vagain\u2028and\x85again\x1c!"]),
+    ],
+)
+def test_iter_lines_separators(mock_fs: Path, contents: str, newline: str | None, lines: list[str]) -> None:
+    p = mock_fs / "lines.txt"
+    p.write_bytes(contents.encode())
+
+    assert list(p.iter_lines(newline=newline)) == lines
+    assert p.read_lines(newline=newline) == lines
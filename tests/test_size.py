@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from fluidpath import Path
+
+
+def test_size_regular_file(mock_fs: Path) -> None:
+    p = mock_fs / "a" / "b" / "file.txt"
+    assert p.size() == len("contents of b/file.txt")
+
+
+def test_size_unit(mock_fs: Path) -> None:
+    p = mock_fs / "a" / "b" / "file.txt"
+    assert p.size(unit="KB") == len("contents of b/file.txt") / 1000  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("unit, factor", [("YB", 10**24), ("RB", 10**27), ("QB", 10**30), ("QiB", 1 << 100)])
+def test_size_large_unit_is_exact(mock_fs: Path, unit: str, factor: int) -> None:
+    p = mock_fs / "a" / "b" / "file.txt"
+    assert p.size(unit=unit) == len("contents of b/file.txt") / factor  # type: ignore
+
+
+def test_size_invalid_unit(mock_fs: Path) -> None:
+    p = mock_fs / "a" / "b" / "file.txt"
+    with pytest.raises(ValueError, match="Invalid size unit"):
+        p.size(unit="XB")  # type: ignore
+
+
+def test_size_directory(mock_fs: Path) -> None:
+    p = mock_fs / "a/"
+    expected = len("contents of b/file.txt") + len("contents of c/file.txt") + len("contents of c/file2.log")
+    assert p.size() == expected
+
+
+def test_size_directory_counts_hardlinks_once(mock_fs: Path) -> None:
+    p = mock_fs / "a/"
+    before = p.size()
+    os.link(mock_fs / "a" / "b" / "file.txt", mock_fs / "a" / "c" / "hardlink.txt")
+
+    assert p.size() == before
+
+
+def test_size_directory_with_workers(mock_fs: Path) -> None:
+    p = mock_fs / "a/"
+    assert p.size(workers=4) == p.size()
+
+
+def test_size_directory_with_workers_counts_hardlinks_once(mock_fs: Path) -> None:
+    p = mock_fs / "a/"
+    before = p.size(workers=4)
+    os.link(mock_fs / "a" / "b" / "file.txt", mock_fs / "a" / "c" / "hardlink.txt")
+    os.link(mock_fs / "a" / "b" / "file.txt", mock_fs / "a" / "hardlink.txt")
+
+    assert p.size(workers=4) == before
+
+
+def test_size_directory_with_workers_single_subdirectory(mock_fs: Path) -> None:
+    p = mock_fs / "a" / "c/"
+    assert p.size(workers=4) == p.size()
+
+
+def test_size_invalid_workers(mock_fs: Path) -> None:
+    p = mock_fs / "a/"
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        p.size(workers=0)
+
+
+def test_size_symlink_to_directory(mock_fs: Path) -> None:
+    p = mock_fs / "symlink-to-dir"
+    assert p.size() == (mock_fs / "a/").size()
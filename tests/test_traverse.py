@@ -0,0 +1,175 @@
+from collections.abc import Callable
+import os
+from typing import Any
+
+import pytest
+
+from fluidpath import Path, PathType
+
+
+def relative_strs(paths: list[Path], root: Path) -> set[str]:
+    return {str(p.relative_to(root)).rstrip(os.sep) for p in paths}
+
+
+def test_traverse(mock_fs: Path) -> None:
+    paths = list((mock_fs / "a/").traverse())
+    assert relative_strs(paths, mock_fs / "a/") == {
+        ".",
+        "b",
+        "b/file.txt",
+        "c",
+        "c/file.txt",
+        "c/file2.log",
+        "c/d",
+        "c/d/image.png",
+    }
+
+
+def test_traverse_hidden(mock_fs: Path) -> None:
+    names = {p.name for p in mock_fs.traverse(show_hidden=False)}
+    assert ".hidden-file" not in names
+    assert "file.ext1.ext2.ext3" in names
+
+
+@pytest.mark.parametrize(
+    "exclude_globs, excluded",
+    [
+        (["*.log"], {"c/file2.log"}),
+        (["c"], {"c", "c/file.txt", "c/file2.log", "c/d", "c/d/image.png"}),
+        (["*.png", "b/*"], {"b/file.txt", "c/d/image.png"}),
+        (["*.log", "*.png", "*.log"], {"c/file2.log", "c/d/image.png"}),
+    ],
+)
+def test_traverse_exclude_globs(mock_fs: Path, exclude_globs: list[str], excluded: set[str]) -> None:
+    root = mock_fs / "a/"
+    everything = relative_strs(list(root.traverse()), root)
+    assert relative_strs(list(root.traverse(exclude_globs=exclude_globs)), root) == everything - excluded
+
+
+@pytest.mark.parametrize(
+    "max_depth, expected",
+    [
+        (0, {"."}),
+        (1, {".", "b", "c"}),
+        (2, {".", "b", "b/file.txt", "c", "c/file.txt", "c/file2.log", "c/d"}),
+    ],
+)
+def test_traverse_max_depth(mock_fs: Path, max_depth: int, expected: set[str]) -> None:
+    root = mock_fs / "a/"
+    assert relative_strs(list(root.traverse(max_depth=max_depth)), root) == expected
+
+
+def test_find_depth(mock_fs: Path) -> None:
+    root = mock_fs / "a/"
+    assert relative_strs(list(root.find(min_depth=2, max_depth=2)), root) == {
+        "b/file.txt",
+        "c/file.txt",
+        "c/file2.log",
+        "c/d",
+    }
+
+
+def test_traverse_bottom_up(mock_fs: Path) -> None:
+    root = mock_fs / "a/"
+    paths = list(root.traverse(top_down=False))
+
+    assert set(paths) == set(root.traverse())
+    assert paths[-1] == root
+    assert paths.index(root / "c" / "d/") < paths.index(root / "c/")
+
+
+def test_traverse_symlinks_not_followed(mock_fs: Path) -> None:
+    paths = relative_strs(list(mock_fs.traverse()), mock_fs)
+    assert "symlink-to-dir" in paths
+    assert "symlink-to-dir/b" not in paths
+
+
+def test_find_type_without_stat(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = mock_fs / "a/"
+    calls: list[Any] = []
+
+    def counting(func: Callable[..., os.stat_result]) -> Callable[..., os.stat_result]:
+        def wrapper(*args: Any, **kwargs: Any) -> os.stat_result:
+            calls.append(args[0])
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    with monkeypatch.context() as m:
+        m.setattr(os, "stat", counting(os.stat))
+        m.setattr(os, "lstat", counting(os.lstat))
+
+        directories = list(root.find(type=PathType.DIRECTORY))
+        logs = list(root.find(type=PathType.REGULAR_FILE, extension="log"))
+
+    assert relative_strs(directories, root) == {".", "b", "c", "c/d"}
+    assert relative_strs(logs, root) == {"c/file2.log"}
+
+    # only the starting directory (which has no directory entry) needs to be stat-ed
+    assert all(os.fspath(c) == os.fspath(root) for c in calls)
+
+
+def test_traverse_paths_see_later_changes(mock_fs: Path) -> None:
+    (found,) = (mock_fs / "a/").find(extension="log")
+    found.write_text("more", mode="a")
+    assert found.size() == len("contents of c/file2.log") + len("more")
+
+    found.delete()
+    assert not found.exists()
+
+
+def test_traverse_with_workers(mock_fs: Path) -> None:
+    paths = list(mock_fs.traverse(workers=4, exclude_globs=["*.log"], max_depth=3))
+    assert sorted(paths) == sorted(mock_fs.traverse(exclude_globs=["*.log"], max_depth=3))
+    assert paths.index(mock_fs / "a" / "c/") < paths.index(mock_fs / "a" / "c" / "file.txt")
+
+
+def test_traverse_invalid_workers(mock_fs: Path) -> None:
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        list(mock_fs.traverse(workers=0))
+
+    with pytest.raises(ValueError, match="top_down=False"):
+        list(mock_fs.traverse(workers=2, top_down=False))
+
+
+@pytest.mark.parametrize(
+    "pattern, glob, expected",
+    [
+        ("*.txt", True, {"b/file.txt", "c/file.txt"}),
+        (r"\.log$", False, {"c/file2.log"}),
+        ("", False, {".", "b", "b/file.txt", "c", "c/file.txt", "c/file2.log", "c/d", "c/d/image.png"}),
+    ],
+)
+def test_find_pattern(mock_fs: Path, pattern: str, glob: bool, expected: set[str]) -> None:
+    root = mock_fs / "a/"
+    assert relative_strs(list(root.find(pattern, glob=glob)), root) == expected
+
+
+@pytest.mark.parametrize(
+    "extension, type, expected",
+    [
+        ("txt", None, {"b/file.txt", "c/file.txt"}),
+        (".log", None, {"c/file2.log"}),
+        (None, PathType.DIRECTORY, {".", "b", "c", "c/d"}),
+        (None, [PathType.SYMLINK, PathType.REGULAR_FILE], {"b/file.txt", "c/file.txt", "c/file2.log", "c/d/image.png"}),
+        ("png", PathType.REGULAR_FILE, {"c/d/image.png"}),
+    ],
+)
+def test_find_extension_and_type(
+    mock_fs: Path,
+    extension: str | None,
+    type: PathType | list[PathType] | None,
+    expected: set[str],
+) -> None:
+    root = mock_fs / "a/"
+    assert relative_strs(list(root.find(extension=extension, type=type)), root) == expected
+
+
+def test_walk_prune(mock_fs: Path) -> None:
+    walked = []
+    for root, dirnames, filenames in (mock_fs / "a/").walk():
+        walked.append((root.name, sorted(dirnames), sorted(filenames)))
+        if "d" in dirnames:
+            dirnames.remove("d")
+
+    assert sorted(walked) == [("a", ["b", "c"], []), ("b", [], ["file.txt"]), ("c", ["d"], ["file.txt", "file2.log"])]
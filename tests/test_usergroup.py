@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+
+from fluidpath import usergroup
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="user names are unavailable on Windows")
+def test_get_uid_of_name() -> None:
+    import pwd
+
+    name = pwd.getpwuid(os.getuid()).pw_name
+    assert usergroup.get_uid_of(name) == os.getuid()
+    assert usergroup.get_user_name_of(os.getuid()) == name
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="group names are unavailable on Windows")
+def test_get_gid_of_name() -> None:
+    import grp
+
+    name = grp.getgrgid(os.getgid()).gr_name
+    assert usergroup.get_gid_of(name) == os.getgid()
+    assert usergroup.get_group_name_of(os.getgid()) == name
+
+
+@pytest.mark.parametrize("value, expected", [(None, -1), (0, 0), (1234, 1234)])
+def test_get_id_of_passthrough(value: int | None, expected: int) -> None:
+    assert usergroup.get_uid_of(value) == expected
+    assert usergroup.get_gid_of(value) == expected
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="user names are unavailable on Windows")
+def test_get_uid_of_unknown_name() -> None:
+    with pytest.raises(KeyError):
+        usergroup.get_uid_of("no-such-user-fluidpath")
@@ -25,15 +25,30 @@ def test_from_pathlib_path_bypass() -> None:
     assert Path._from_pathlib_path(p, semantic_path_type=SemanticPathType.FILE)._path is p
 
 
+def test_from_pathlib_path_initializes_all_slots() -> None:
+    p = Path._from_pathlib_path(pathlib.Path("foo"), semantic_path_type=SemanticPathType.FILE)
+
+    assert not hasattr(p, "__dict__")
+    for slot in Path.__slots__:
+        getattr(p, slot)
+
+
+def test_eq_is_case_sensitive_on_windows() -> None:
+    # pathlib's Windows flavour ignores case, but equality here compares the path strings
+    assert force_windows_pure_path("C:/foo/bar.txt") == force_windows_pure_path("C:/foo/bar.txt")
+    assert force_windows_pure_path("C:/Foo/bar.txt") != force_windows_pure_path("C:/foo/bar.txt")
+
+
 def test_home() -> None:
-    assert isinstance(Path.home()._path, pathlib.Path)
-    assert Path.home()._path == pathlib.Path.home()
+    home = Path.home()
+    assert isinstance(home._path, pathlib.Path)
+    assert home._path == pathlib.Path.home()
 
 
 def test_expand_user() -> None:
-    p = Path("foo")
-    assert isinstance(p.expand_user()._path, pathlib.Path)
-    assert p.expand_user()._path == pathlib.Path("foo").expanduser()
+    expanded = Path("foo").expand_user()
+    assert isinstance(expanded._path, pathlib.Path)
+    assert expanded._path == pathlib.Path("foo").expanduser()
 
 
 def test_from_uri_valid() -> None:
@@ -153,6 +168,15 @@ def test_parents() -> None:
     assert p.parents == (Path("foo/bar/"), Path("foo/"), Path("."))
 
 
+def test_parents_indexing() -> None:
+    p = Path("foo/bar/baz.txt")
+    assert p.parents[0] == Path("foo/bar/")
+    assert p.parents[-1] == Path(".")
+    assert p.parents[1:] == (Path("foo/"), Path("."))
+    assert len(p.parents) == 3
+    assert p.parents[0] is p.parent
+
+
 def test_parent() -> None:
     p = Path("foo") / "bar" / "baz"
     assert p.parent == Path("foo/bar/")
@@ -166,68 +190,77 @@ def test_name() -> None:
 @pytest.mark.parametrize(
     "path, suffix",
     [
-        (Path("/path/to/foo"), ""),
-        (Path("/path/to/foo.txt"), ".txt"),
-        (Path("/path/to/foo/bar.jpg"), ".jpg"),
-        (Path("/path/to/foo/bar/baz.tar.gz"), ".gz"),
-        (Path("."), ""),
-        (Path("./foo"), ""),
+        ("/path/to/foo", ""),
+        ("/path/to/foo.txt", ".txt"),
+        ("/path/to/foo/bar.jpg", ".jpg"),
+        ("/path/to/foo/bar/baz.tar.gz", ".gz"),
+        (".", ""),
+        ("./foo", ""),
     ],
 )
-def test_suffix(path: Path, suffix: str) -> None:
-    assert path.suffix == suffix
+def test_suffix(path: str, suffix: str) -> None:
+    assert Path(path).suffix == suffix
 
 
 @pytest.mark.parametrize(
     "path, suffix",
     [
-        (Path("/path/to/foo."), "."),
-        (Path("/path/to/foo.txt."), "."),
-        (Path("/path/to/foo.txt..........."), "."),
-        (Path("/path/to/foo.txt.jpg.tar.gz.docx."), "."),
-        (Path("./foo."), "."),
-        (Path("." * 1), ""),
-        (Path("." * 2), ""),
-        (Path("." * 3), ""),
-        (Path("." * 37), ""),
-        (Path("." * 12_142_896), ""),
+        ("/path/to/foo.", "."),
+        ("/path/to/foo.txt.", "."),
+        ("/path/to/foo.txt...........", "."),
+        ("/path/to/foo.txt.jpg.tar.gz.docx.", "."),
+        ("./foo.", "."),
+        ("." * 1, ""),
+        ("." * 2, ""),
+        ("." * 3, ""),
+        ("." * 37, ""),
     ],
 )
-def test_suffix_trailing_dot(path: Path, suffix: str) -> None:
-    assert path.suffix == suffix
+def test_suffix_trailing_dot(path: str, suffix: str) -> None:
+    assert Path(path).suffix == suffix
+
+
+@pytest.mark.slow
+def test_suffix_many_dots() -> None:
+    # built here rather than in the parametrize list, so the ~12 MB string only lives while this test runs
+    assert Path("." * 12_142_896).suffix == ""
 
 
 @pytest.mark.parametrize(
     "path, suffixes",
     [
-        (Path("/path/to/foo"), []),
-        (Path("/path/to/foo.txt"), [".txt"]),
-        (Path("/path/to/foo/bar.jpg"), [".jpg"]),
-        (Path("/path/to/foo/bar/baz.tar.gz"), [".tar", ".gz"]),
-        (Path("./foo"), []),
+        ("/path/to/foo", []),
+        ("/path/to/foo.txt", [".txt"]),
+        ("/path/to/foo/bar.jpg", [".jpg"]),
+        ("/path/to/foo/bar/baz.tar.gz", [".tar", ".gz"]),
+        ("./foo", []),
     ],
 )
-def test_suffixes(path: Path, suffixes: list[str]) -> None:
-    assert path.suffixes == suffixes
+def test_suffixes(path: str, suffixes: list[str]) -> None:
+    assert Path(path).suffixes == suffixes
 
 
 @pytest.mark.parametrize(
     "path, suffixes",
     [
-        (Path("/path/to/foo."), ["."]),
-        (Path("/path/to/foo.txt."), [".txt", "."]),
-        (Path("/path/to/foo.txt..........."), [".txt", "."]),
-        (Path("/path/to/foo.txt.jpg.tar.gz.docx."), [".txt", ".jpg", ".tar", ".gz", ".docx", "."]),
-        (Path("./foo."), ["."]),
-        (Path("." * 1), []),
-        (Path("." * 2), []),
-        (Path("." * 3), []),
-        (Path("." * 37), []),
-        (Path("." * 12_142_896), []),
+        ("/path/to/foo.", ["."]),
+        ("/path/to/foo.txt.", [".txt", "."]),
+        ("/path/to/foo.txt...........", [".txt", "."]),
+        ("/path/to/foo.txt.jpg.tar.gz.docx.", [".txt", ".jpg", ".tar", ".gz", ".docx", "."]),
+        ("./foo.", ["."]),
+        ("." * 1, []),
+        ("." * 2, []),
+        ("." * 3, []),
+        ("." * 37, []),
     ],
 )
-def test_suffixes_trailing_dot(path: Path, suffixes: list[str]) -> None:
-    assert path.suffixes == suffixes
+def test_suffixes_trailing_dot(path: str, suffixes: list[str]) -> None:
+    assert Path(path).suffixes == suffixes
+
+
+@pytest.mark.slow
+def test_suffixes_many_dots() -> None:
+    assert Path("." * 12_142_896).suffixes == []
 
 
 def test_stem() -> None:
@@ -235,214 +268,228 @@ def test_stem() -> None:
     assert p.stem == "baz"
 
 
-def test_absolute(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_absolute(mock_fs: Path) -> None:
     p = Path("a") / "c" / "file.txt"
     assert p.absolute() == mock_fs / "a" / "c" / "file.txt"
 
 
-def test_is_absolute_true(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_is_absolute_true(mock_fs: Path) -> None:
     p = mock_fs / "a" / "c" / "file.txt"
     assert p.is_absolute()
 
 
-def test_is_absolute_false(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_is_absolute_false(mock_fs: Path) -> None:
     p = Path("a") / "c" / "file.txt"
     assert not p.is_absolute()
 
 
-def test_resolve_regular_file(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_resolve_regular_file(mock_fs: Path) -> None:
     p = Path("a") / "c" / "file.txt"
     assert p.resolve() == mock_fs / "a" / "c" / "file.txt"
 
 
-def test_resolve_symlink(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_resolve_symlink(mock_fs: Path) -> None:
     # NB: mock_fs/symlink-to-file --> mock_fs/a/b/file.txt
     p = Path("symlink-to-file")
     assert p.resolve() == mock_fs / "a" / "b" / "file.txt"
 
 
-def test_read_link_with_symlink(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_read_link_with_symlink(mock_fs: Path) -> None:
     # NB: mock_fs/symlink-to-file --> mock_fs/a/b/file.txt
     p = Path("symlink-to-file")
     assert p.read_link() == mock_fs / "a" / "b" / "file.txt"
 
 
-def test_read_link_with_symlink_to_dir(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_read_link_with_symlink_to_dir(mock_fs: Path) -> None:
     # NB: mock_fs/symlink-to-dir --> mock_fs/a
     p = Path("symlink-to-dir")
     assert p.read_link() == mock_fs / "a/"
 
 
-def test_read_link_with_broken_symlink(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_read_link_with_broken_symlink(mock_fs: Path) -> None:
     # NB: mock_fs/broken-symlink --> nonexistent-target
     p = Path("broken-symlink")
     assert p.read_link() == mock_fs / "nonexistent-target"
 
 
-def test_read_link_with_non_symlink(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_read_link_with_non_symlink(mock_fs: Path) -> None:
     p = mock_fs / "a" / "b" / "file.txt"
     with pytest.raises(OSError, match="Invalid argument"):
         p.read_link()
 
 
-def test_stat_regular_file(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_stat_regular_file(mock_fs: Path) -> None:
     p = mock_fs / "a" / "b" / "file.txt"
     assert p.stat() == os.stat(p)
 
 
-def test_stat_symlink(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_stat_symlink(mock_fs: Path) -> None:
     # NB: mock_fs/symlink-to-file --> mock_fs/a/b/file.txt
     p = Path("symlink-to-file")
-    assert p.stat() == os.stat(p)
-    assert p.stat() == os.stat(p.read_link())
-
+    st = p.stat()
+    assert st == os.stat(p)
+    assert st == os.stat(p.read_link())
 
-def test_stat_symlink_follow_false(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
 
+def test_stat_symlink_follow_false(mock_fs: Path) -> None:
     # NB: mock_fs/symlink-to-file --> mock_fs/a/b/file.txt
     p = Path("symlink-to-file")
-    assert p.stat(follow_symlinks=False) == os.lstat(p)
-    assert p.stat(follow_symlinks=False) != os.stat(p.read_link())
+    st = p.stat(follow_symlinks=False)
+    assert st == os.lstat(p)
+    assert st != os.stat(p.read_link())
 
 
-def test_stat_symlink_to_dir(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_stat_symlink_to_dir(mock_fs: Path) -> None:
     # NB: mock_fs/symlink-to-dir --> mock_fs/a
     p = Path("symlink-to-dir")
-    assert p.stat() == os.stat(p)
-    assert p.stat() == os.stat(p.read_link())
-
-
-def test_is_relative_to_true_with_strict(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
+    st = p.stat()
+    assert st == os.stat(p)
+    assert st == os.stat(p.read_link())
 
-    p = mock_fs / "a" / "b" / "file.txt"
-    q = mock_fs / "a"
-    assert p.is_relative_to(q, strict=True)
 
+def test_stat_from_direntry(mock_fs: Path) -> None:
+    with os.scandir(mock_fs / "a" / "b") as entries:
+        (p,) = [Path.from_direntry(entry) for entry in entries]
 
-def test_is_relative_to_true_without_strict(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
+    assert p == mock_fs / "a" / "b" / "file.txt"
+    assert p.name == "file.txt"
+    assert p.stat() == os.stat(p)
 
-    p = mock_fs / "a" / "b" / "file.txt"
-    q = mock_fs / "a"
-    assert p.is_relative_to(q)
 
+def test_iterdir_children_see_later_changes(mock_fs: Path) -> None:
+    (p,) = (mock_fs / "a" / "b").iterdir()
+    assert p.size() == len("contents of b/file.txt")
 
-def test_is_relative_to_false_with_strict(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
-    p = mock_fs / "a" / "b" / "file.txt"
-    q = mock_fs / "a"
-    assert not q.is_relative_to(p, strict=True)
+    Path(str(p)).write_text("more", mode="a")
+    assert p.size() == len("contents of b/file.txt") + len("more")
 
+    Path(str(p)).delete()
+    assert not p.exists()
 
-def test_is_relative_to_false_without_strict(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
 
+def test_stat_cached(mock_fs: Path) -> None:
     p = mock_fs / "a" / "b" / "file.txt"
-    q = mock_fs / "a"
-    assert not q.is_relative_to(p)
-
-
-def test_is_relative_to_literal_true_semantic_false_without_strict(
-    mock_fs: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    monkeypatch.chdir(mock_fs)
-
-    p = mock_fs / "a" / "b"
-    q = mock_fs / "a" / "b" / ".."  # mock_fs/a
-
-    assert q.is_relative_to(p, strict=False)
-
-
-def test_is_relative_to_literal_true_semantic_false_with_strict(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
+    with p.stat_cached():
+        before = p.stat()
+        Path(str(p)).write_text("new contents", mode="a")
+        assert p.stat() is before
 
-    p = mock_fs / "a" / "b"
-    q = mock_fs / "a" / "b" / ".."  # mock_fs/a
+        p.refresh()
+        after = p.stat()
+        assert after.st_size > before.st_size
 
-    assert not q.is_relative_to(p, strict=True)
+        # modifying the path through the same object discards the memoized results
+        p.write_text("more contents", mode="a")
+        assert p.stat().st_size > after.st_size
 
+    assert p._stat_cache is None
 
-def test_relative_to_true_with_strict(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
 
+def test_stat_cached_nested(mock_fs: Path) -> None:
     p = mock_fs / "a" / "b" / "file.txt"
-    q = mock_fs / "a"
-    assert p.relative_to(q, strict=True) == Path("b/file.txt")
+    with p.stat_cached():
+        before = p.stat()
 
+        with p.stat_cached():
+            assert p.stat() is before
 
-def test_relative_to_true_without_strict(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
-    p = mock_fs / "a" / "b" / "file.txt"
-    q = mock_fs / "a"
-    assert p.relative_to(q) == Path("b/file.txt")
+        # leaving the inner block doesn't end the outer one
+        Path(str(p)).write_text("new contents", mode="a")
+        assert p.stat() is before
 
+    assert p._stat_cache is None
 
-def test_relative_to_literal_true_semantic_false_without_strict(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
 
-    p = mock_fs / "a" / "b"
-    q = mock_fs / "a" / "b" / ".."  # mock_fs/a
+def test_stat_cached_nonexistent(mock_fs: Path) -> None:
+    p = mock_fs / "missing.txt"
+    with p.stat_cached():
+        assert not p.exists()
 
-    assert q.relative_to(p, strict=False) == Path("..")
+        p.touch()
+        assert p.exists()
 
+        os.remove(p)
+        assert p.exists()  # the result of the touch is still cached
 
-def test_relative_to_literal_true_semantic_false_with_strict(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
+        p.refresh()
+        assert not p.exists()
+        with pytest.raises(FileNotFoundError):
+            p.stat()
 
-    p = mock_fs / "a" / "b"
-    q = mock_fs / "a" / "b" / ".."  # mock_fs/a
 
-    with pytest.raises(ValueError):
-        q.relative_to(p, strict=True)
+@pytest.mark.parametrize(
+    "path, other, strict, expected",
+    [
+        ("a/b/file.txt", "a", True, True),
+        ("a/b/file.txt", "a", False, True),
+        ("a", "a/b/file.txt", True, False),
+        ("a", "a/b/file.txt", False, False),
+        # a/b/../ is literally within a/b, but semantically (once resolved) it is a itself
+        ("a/b/../", "a/b", False, True),
+        ("a/b/../", "a/b", True, False),
+    ],
+)
+def test_is_relative_to(mock_fs: Path, path: str, other: str, strict: bool, expected: bool) -> None:
+    assert (mock_fs / path).is_relative_to(mock_fs / other, strict=strict) == expected
 
 
-def test_is_reserved_windows_true(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(os.path, "isreserved", lambda _: True, raising=False)
+@pytest.mark.parametrize(
+    "path, other, strict, expected",
+    [
+        ("a/b/file.txt", "a", True, "b/file.txt"),
+        ("a/b/file.txt", "a", False, "b/file.txt"),
+        ("a/b/../", "a/b", False, ".."),
+        ("a/b/../", "a/b", True, None),
+    ],
+)
+def test_relative_to(mock_fs: Path, path: str, other: str, strict: bool, expected: str | None) -> None:
+    p = mock_fs / path
+    q = mock_fs / other
 
-    p = force_windows_pure_path("C://User/CON")
-    assert p.is_reserved()
+    if expected is None:
+        with pytest.raises(ValueError):
+            p.relative_to(q, strict=strict)
+    else:
+        assert p.relative_to(q, strict=strict) == Path(expected)
 
 
-def test_is_reserved_windows_false(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(os.path, "isreserved", lambda _: False, raising=False)
+@pytest.mark.parametrize(
+    "path, other, expected",
+    [
+        ("/foo/bar/baz.txt", "/foo/bar/", "baz.txt"),
+        ("/foo/bar/baz.txt", "/", "foo/bar/baz.txt"),
+        ("/foo/bar/", "/foo/bar/", "."),
+        ("/foo/barbaz/", "/foo/bar/", None),
+        ("//foo/bar/", "/", None),
+        ("foo/bar/baz.txt", "foo/", "bar/baz.txt"),
+        ("foo/bar/baz.txt", ".", "foo/bar/baz.txt"),
+        ("foo/bar/baz.txt", "/foo/", None),
+    ],
+)
+def test_relative_to_without_strict(path: str, other: str, expected: str | None) -> None:
+    p = Path(path)
 
-    p = force_windows_pure_path("C://User/Documents/File.txt")
-    assert not p.is_reserved()
+    if expected is None:
+        assert not p.is_relative_to(other)
+        with pytest.raises(ValueError, match="is not in the subpath of"):
+            p.relative_to(other)
+    else:
+        assert p.is_relative_to(other)
+        assert p.relative_to(other) == Path(expected + p._semantic_path_type.value)
 
 
-def test_is_reserved_posix_false(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(os.path, "isreserved", lambda _: False, raising=False)
+@pytest.mark.parametrize(
+    "path, reserved",
+    [
+        (force_windows_pure_path("C://User/CON"), True),
+        (force_windows_pure_path("C://User/Documents/File.txt"), False),
+        (force_posix_pure_path("/var/log/file.log"), False),
+    ],
+)
+def test_is_reserved(monkeypatch: pytest.MonkeyPatch, path: Path, reserved: bool) -> None:
+    monkeypatch.setattr(os.path, "isreserved", lambda _: reserved, raising=False)
 
-    p = force_posix_pure_path("/var/log/file.log")
-    assert not p.is_reserved()
+    assert path.is_reserved() == reserved
 
 
 def test_join_path_zero_layers() -> None:
@@ -522,36 +569,26 @@ def test_with_suffix_with_trailing_dot() -> None:
     assert p.with_suffix(".new.") == Path("root") / "a" / "b.new."
 
 
-def test_exists_true(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_exists_true(mock_fs: Path) -> None:
     p = mock_fs / "a" / "b" / "file.txt"
     assert p.exists()
 
 
-def test_exists_false(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_exists_false(mock_fs: Path) -> None:
     p = mock_fs / "a" / "b" / "does-not-exist"
     assert not p.exists()
 
 
-def test_exists_symlink_valid(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_exists_symlink_valid(mock_fs: Path) -> None:
     p = mock_fs / "symlink-to-file"
     assert p.exists()
 
 
-def test_exists_symlink_broken_following(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_exists_symlink_broken_following(mock_fs: Path) -> None:
     p = mock_fs / "broken-symlink"
     assert not p.exists(follow_symlinks=True)
 
 
-def test_exists_symlink_broken_not_following(mock_fs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.chdir(mock_fs)
-
+def test_exists_symlink_broken_not_following(mock_fs: Path) -> None:
     p = mock_fs / "broken-symlink"
     assert p.exists(follow_symlinks=False)